@@ -0,0 +1,27 @@
+"""
+Development bootstrapper shared by the Dictationer entry point scripts.
+
+setup.py registers src/ with the virtual environment through a
+dictationer.pth file, so the package is normally importable as-is. This
+module only covers venvs created before that file existed.
+"""
+
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).parent / 'src'
+
+
+def load_dictationer():
+    """
+    Make the local dictationer package importable.
+
+    Reason: falls back to a single sys.path insert only when the .pth file
+    from setup.py is missing, e.g. in an older virtual environment.
+    """
+    try:
+        import dictationer  # noqa: F401
+    except ImportError:
+        src = str(SRC_DIR)
+        if src not in sys.path:
+            sys.path.insert(0, src)
@@ -22,59 +22,66 @@ import sys
 import os
 from pathlib import Path
 
-# Add the src directory to the Python path for development
+from bootstrap import load_dictationer
+
 current_dir = Path(__file__).parent
-src_dir = current_dir / 'src'
-sys.path.insert(0, str(src_dir))
+load_dictationer()
+
 
-# Import and run the GUI
-try:
-    from dictationer.gui import run_gui
+def main():
+    """
+    Main entry point for the GUI application.
     
-    def main():
-        """
-        Main entry point for the GUI application.
-        
-        This function serves as the primary entry point that:
-        1. Sets up the Python path for the dictationer package
-        2. Ensures all dependencies are available
-        3. Launches the PySide6 GUI interface
-        4. Handles any startup errors gracefully
-        
-        The GUI will load before any recording functionality is initialized,
-        allowing users to configure settings before starting the system.
-        """
-        print("🎤 Dictationer - Voice Recording System")
-        print("=" * 50)
-        print("Starting GUI interface...")
-        print("Please configure your settings before starting the recording system.")
-        print()
-        
-        # Ensure required directories exist
-        for directory in ['config', 'outputs', 'logs']:
-            dir_path = current_dir / directory
-            dir_path.mkdir(exist_ok=True)
+    This function serves as the primary entry point that:
+    1. Ensures the config, outputs and logs directories exist
+    2. Imports the GUI module (importable through the dictationer.pth file
+       written by setup.py, see bootstrap.load_dictationer())
+    3. Launches the PySide6 GUI interface
+    4. Handles any startup errors gracefully
+    
+    The GUI will load before any recording functionality is initialized,
+    allowing users to configure settings before starting the system.
+    """
+    print("🎤 Dictationer - Voice Recording System")
+    print("=" * 50)
+    print("Starting GUI interface...")
+    print("Please configure your settings before starting the recording system.")
+    print()
+    
+    # Ensure required directories exist
+    # Reason: one scandir replaces a stat per directory on warm starts
+    with os.scandir(current_dir) as entries:
+        existing = {entry.name for entry in entries if entry.is_dir()}
+    for directory in ('config', 'outputs', 'logs'):
+        if directory not in existing:
+            os.makedirs(current_dir / directory, exist_ok=True)
+    
+    # Reason: the GUI module pulls in PySide6, torch and faster_whisper,
+    # which takes seconds. Import it only after the banner is shown.
+    try:
+        from dictationer.gui import run_gui
         
         # Launch GUI
         run_gui()
+    
+    except ImportError as e:
+        print("❌ Error: Failed to import required modules")
+        print(f"Details: {e}")
+        print()
+        print("Please make sure all dependencies are installed:")
+        print("  pip install PySide6 torch python-dotenv")
+        print()
+        print("Or install the full package with:")
+        print("  pip install -e .")
+        sys.exit(1)
+    
+    except Exception as e:
+        print(f"❌ Unexpected error starting GUI: {e}")
+        print()
+        print("Please check the installation and try again.")
+        print("If the problem persists, check the logs directory for more details.")
+        sys.exit(1)
 
-    if __name__ == "__main__":
-        main()
-
-except ImportError as e:
-    print("❌ Error: Failed to import required modules")
-    print(f"Details: {e}")
-    print()
-    print("Please make sure all dependencies are installed:")
-    print("  pip install PySide6 torch python-dotenv")
-    print()
-    print("Or install the full package with:")
-    print("  pip install -e .")
-    sys.exit(1)
 
-except Exception as e:
-    print(f"❌ Unexpected error starting GUI: {e}")
-    print()
-    print("Please check the installation and try again.")
-    print("If the problem persists, check the logs directory for more details.")
-    sys.exit(1)
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -5,13 +5,11 @@ This script provides a simple entry point that imports and runs
 the main functionality from the dictationer package.
 """
 
-import sys
-import os
+from bootstrap import load_dictationer
 
-# Add the src directory to the Python path for development
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+load_dictationer()
 
 from dictationer.main import main
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
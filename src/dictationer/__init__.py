@@ -7,6 +7,26 @@ A voice recording system with keyboard hotkey control and threaded architecture.
 __version__ = "1.0.0"
 __author__ = "Voice Recording System"
 
-from .main import RecordingController
+__all__ = ["RecordingController"]
 
-__all__ = ["RecordingController"]
\ No newline at end of file
+
+def __getattr__(name):
+    """
+    Lazily resolve heavy package attributes on first access (PEP 562).
+
+    Reason: importing RecordingController pulls in audio capture, Whisper and
+    keyboard hooks, which every consumer (including the GUI) would otherwise pay for.
+
+    Args:
+        name (str): Attribute name being looked up.
+
+    Returns:
+        Any: The requested attribute.
+
+    Raises:
+        AttributeError: If the attribute does not exist.
+    """
+    if name == "RecordingController":
+        from .main import RecordingController
+        return RecordingController
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,53 +6,64 @@ as WAV files with 16-bit depth and 16kHz sample rate.
 """
 
 import pyaudio
-import wave
+import struct
 import threading
 import time
 import logging
 from typing import Optional
 import os
 import tempfile
-import shutil
+import sys
+import queue
+from concurrent.futures import ThreadPoolExecutor
 
-# Import status indicator
+# Import NumPy for the transcription window (installed with faster-whisper)
 try:
-    from .status_indicator import show_recording, show_transcribing, hide_indicator
-    STATUS_INDICATOR_AVAILABLE = True
-except ImportError as e:
-    STATUS_INDICATOR_AVAILABLE = False
-    print(f"[DEBUG] Status indicator not available: {e}")
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
-# Import AudioProcessor for automatic transcription
-try:
-    from .processor import AudioProcessor
-    PROCESSOR_AVAILABLE = True
-    print("[DEBUG] AudioProcessor import: SUCCESS")
-except ImportError as e:
-    PROCESSOR_AVAILABLE = False
-    _processor_import_error = str(e)
-    print(f"[DEBUG] AudioProcessor import: FAILED - {e}")
+logger = logging.getLogger(__name__)
 
-# Test individual dependencies
-print("[DEBUG] Testing processor dependencies...")
-try:
-    from faster_whisper import WhisperModel
-    print("[DEBUG] faster-whisper: OK")
-except ImportError as e:
-    print(f"[DEBUG] faster-whisper: FAILED - {e}")
+# Canonical 44-byte RIFF/WAVE header layout for PCM audio
+_WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
 
-try:
-    from watchdog.observers import Observer
-    print("[DEBUG] watchdog: OK")
-except ImportError as e:
-    print(f"[DEBUG] watchdog: FAILED - {e}")
+# Write buffer for the streamed WAV file (~2 s of 16kHz mono PCM16)
+_WAV_BUFFER_SIZE = 64 * 1024
+
+# Silence gate (VAD) frame length
+_FRAME_MS = 30
+
+# VAD frames per capture buffer (120 ms)
+_FRAMES_PER_BUFFER = 4
+
+# Length of the rolling windows transcribed while recording (Whisper's own window)
+_CHUNK_SECONDS = 30
+
+# Extra audio a full window may take while waiting for a pause to cut at
+_CHUNK_OVERRUN_SECONDS = 10
 
+# Transcription windows allocated before recording; filled ones are reused once transcribed
+_WINDOW_POOL_SIZE = 3
+
+# Windows accumulated per transcription call when batched inference is available
+_CHUNKS_PER_BATCH = 4
+
+# Import status indicator
 try:
-    from .paster import ClipboardPaster
-    print("[DEBUG] paster: OK")
+    from .status_indicator import show_recording, show_transcribing, hide_indicator
+    STATUS_INDICATOR_AVAILABLE = True
 except ImportError as e:
-    print(f"[DEBUG] paster: FAILED - {e}")
+    STATUS_INDICATOR_AVAILABLE = False
+    logger.debug("Status indicator not available: %s", e)
 
+# Import silence gate for dropping silence before save and transcription
+try:
+    from .audio_dsp import create_silence_gate
+    SILENCE_GATE_AVAILABLE = True
+except ImportError:
+    SILENCE_GATE_AVAILABLE = False
 
 class AudioRecorder:
     """
@@ -61,12 +72,12 @@ class AudioRecorder:
     Attributes:
         sample_rate (int): Audio sample rate in Hz.
         channels (int): Number of audio channels.
-        chunk_size (int): Size of audio chunks to read.
+        chunk_size (int): Frames per capture buffer (120 ms).
         format (int): PyAudio format for audio data.
         output_file (str): Path to output WAV file.
     """
     
-    def __init__(self, output_file: str = "recording.wav", enable_transcription: bool = True, model_size: str = "base", auto_paste: bool = True):
+    def __init__(self, output_file: str = "recording.wav", enable_transcription: bool = True, model_size: str = "base", auto_paste: bool = True, compute_type: Optional[str] = None, device: str = "auto", save_wav: bool = True, beam_size: int = 1, vad_filter: bool = True):
         """
         Initialize audio recorder.
         
@@ -75,50 +86,92 @@ class AudioRecorder:
             enable_transcription (bool): Whether to enable automatic transcription. Defaults to True.
             model_size (str): Whisper model size for transcription. Defaults to "base".
             auto_paste (bool): Whether to automatically paste transcribed text. Defaults to True.
+            compute_type (Optional[str]): Whisper compute type, e.g. "int8" or "float16".
+                Defaults to None ("int8_float16" on CUDA, "int8" on CPU).
+            device (str): "cuda", "cpu", or "auto" to use CUDA when a GPU is detected. Defaults to "auto".
+            save_wav (bool): Whether to also write each recording to output_file. Transcription
+                works from memory either way. Defaults to True.
+            beam_size (int): Whisper beam width. Defaults to 1 (greedy decoding), which keeps
+                dictation responsive; larger beams are slower but slightly more accurate.
+            vad_filter (bool): Whether faster-whisper also drops non-speech with its Silero VAD
+                before decoding. Defaults to True.
         """
         self.logger = logging.getLogger(__name__)
-        self.logger.info(f"[AUDIO] Initializing AudioRecorder with output: {output_file}")
+        self.logger.info("[AUDIO] Initializing AudioRecorder with output: %s", output_file)
         
         self.sample_rate = 16000  # 16kHz
         self.channels = 1  # Mono recording
-        self.chunk_size = 1024
+        # Reason: buffers of whole VAD frames (1920 frames at 16kHz) let the
+        # gate classify each callback in place with no carry-over, while 8
+        # callbacks/s instead of 33 cut GIL handoffs; stopping drops at most
+        # one partly filled buffer, so it is kept short enough to not clip
+        # the last word
+        self.chunk_size = self.sample_rate * _FRAME_MS // 1000 * _FRAMES_PER_BUFFER
         self.format = pyaudio.paInt16  # 16-bit
+        self._sampwidth = pyaudio.get_sample_size(self.format)  # 2 bytes for paInt16
+        self._bytes_per_second = self.sample_rate * self.channels * self._sampwidth
         self.output_file = output_file
+        self._output_dir = os.path.dirname(output_file) or '.'
         self.enable_transcription = enable_transcription
         self.auto_paste = auto_paste
+        self.save_wav = save_wav
         
-        self._recording = False
-        self._thread: Optional[threading.Thread] = None
-        self._frames = []
-        self._audio: Optional[pyaudio.PyAudio] = None
+        self._recording = threading.Event()  # Set while recording; read without the lock
+        self._wav_file = None  # Open binary file while recording
+        self._temp_path: Optional[str] = None
+        self._bytes_written = 0
+        self._audio: Optional[pyaudio.PyAudio] = None  # Created on first recording, kept until cleanup
         self._stream: Optional[pyaudio.Stream] = None
         self._thread_lock = threading.Lock()
         
+        # Rolling window of captured audio, cut at the first pause after _CHUNK_SECONDS
+        self._chunk_samples = _CHUNK_SECONDS * self.sample_rate * self.channels
+        self._overrun_samples = _CHUNK_OVERRUN_SECONDS * self.sample_rate * self.channels
+        self._window = None  # Preallocated int16 array, filled by the capture callback
+        self._window_len = 0
+        self._free_windows = queue.SimpleQueue()  # Empty windows ready for the callback
+        self._windows_allocated = 0
+        self._chunk_futures = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        # Drop silent frames inline (WebRTC VAD, or an RMS energy gate fallback)
+        self._speech_gate = create_silence_gate(self.sample_rate, _FRAME_MS) if SILENCE_GATE_AVAILABLE else None
+        
+        if self.save_wav:
+            os.makedirs(self._output_dir, exist_ok=True)
+        
         # Initialize AudioProcessor for transcription if available and enabled
         self.processor = None
         
-        self.logger.info(f"[AUDIO] Processor initialization check:")
-        self.logger.info(f"[AUDIO] - enable_transcription: {self.enable_transcription}")
-        self.logger.info(f"[AUDIO] - PROCESSOR_AVAILABLE: {PROCESSOR_AVAILABLE}")
-        print(f"[DEBUG] enable_transcription: {self.enable_transcription}")
-        print(f"[DEBUG] PROCESSOR_AVAILABLE: {PROCESSOR_AVAILABLE}")
+        # Reason: the processor pulls in faster-whisper and watchdog, which take
+        # hundreds of ms to import, so it is only imported when transcription is on
+        processor_available = False
+        processor_import_error = None
+        if self.enable_transcription:
+            try:
+                from .processor import AudioProcessor
+                processor_available = True
+            except ImportError as e:
+                processor_import_error = str(e)
+        
+        self.logger.debug("[AUDIO] Processor initialization check:")
+        self.logger.debug("[AUDIO] - enable_transcription: %s", self.enable_transcription)
+        self.logger.debug("[AUDIO] - Processor available: %s", processor_available)
         
-        if self.enable_transcription and PROCESSOR_AVAILABLE:
+        if self.enable_transcription and processor_available:
             try:
                 # Use exact model name without normalization
                 original_model_size = model_size
-                self.logger.info(f"[AUDIO] Using exact model name: '{model_size}'")
-                print(f"[DEBUG] Using exact model name: '{model_size}'")
+                self.logger.debug("[AUDIO] Using exact model name: '%s'", model_size)
                 
-                self.logger.info(f"[AUDIO] Initializing AudioProcessor with model: {model_size}")
-                print(f"[DEBUG] Initializing AudioProcessor with model: {model_size}")
+                self.logger.debug("[AUDIO] Initializing AudioProcessor with model: %s", model_size)
                 
                 # Check if HuggingFace model is available (using normalized name)
                 if "/" in model_size:
                     try:
                         from .config import ModelDetector
                         if not ModelDetector.is_model_cached(model_size):
-                            self.logger.warning(f"[AUDIO] HuggingFace model '{model_size}' not found in cache")
+                            self.logger.warning("[AUDIO] HuggingFace model '%s' not found in cache", model_size)
                             print(f"[WARNING] Model '{model_size}' not found in cache")
                             print(f"[WARNING] This may cause loading to fail or be very slow")
                     except ImportError:
@@ -126,8 +179,7 @@ class AudioRecorder:
                 
                 # Extract directory from output_file for processor watch directory
                 output_dir = os.path.dirname(self.output_file) or "outputs"
-                self.logger.info(f"[AUDIO] Watch directory: {output_dir}")
-                print(f"[DEBUG] Watch directory: {output_dir}")
+                self.logger.debug("[AUDIO] Watch directory: %s", output_dir)
                 
                 # Create processor instance with file monitoring DISABLED
                 # We'll use direct transcription calls instead to avoid dual processing
@@ -135,22 +187,38 @@ class AudioRecorder:
                     model_size=model_size, 
                     watch_directory=output_dir, 
                     auto_paste=self.auto_paste, 
-                    enable_file_monitoring=False
+                    enable_file_monitoring=False,
+                    compute_type=compute_type,
+                    device=device,
+                    beam_size=beam_size,
+                    vad_filter=vad_filter
                 )
-                self.logger.info("[AUDIO] AudioProcessor created successfully")
-                print("[DEBUG] AudioProcessor created successfully")
-                self.logger.info("[AUDIO] Using direct transcription mode (no file monitoring)")
-                print("[DEBUG] Using direct transcription mode (no file monitoring)")
+                self.logger.debug("[AUDIO] AudioProcessor created successfully")
+                self.logger.debug("[AUDIO] Transcription device: %s (requested: %s)", self.processor.device_config['device'], device)
+                
+                # Reason: one worker keeps chunks in order; faster-whisper releases
+                # the GIL, so decoding overlaps with capture instead of waiting for stop.
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="Transcribe")
+                
+                # Warm the model on the transcription worker so it runs before
+                # (and never concurrently with) the first real transcription
+                self._executor.submit(self._warm_model)
+                
+                # The batched pipeline decodes several 30 s windows in one call
+                if getattr(self.processor, 'batched_model', None) is not None:
+                    self._chunk_samples *= _CHUNKS_PER_BATCH
+                    self.logger.debug("[AUDIO] Batched transcription: %ss per chunk", _CHUNK_SECONDS * _CHUNKS_PER_BATCH)
+                self.logger.debug("[AUDIO] Using direct transcription mode (no file monitoring)")
                 
             except Exception as e:
                 import traceback
                 
                 # Enhanced error logging with full details
                 error_traceback = traceback.format_exc()
-                self.logger.error(f"[AUDIO] Failed to initialize AudioProcessor: {e}")
-                self.logger.error(f"[AUDIO] Error type: {type(e).__name__}")
-                self.logger.error(f"[AUDIO] Model causing error: '{model_size}'")
-                self.logger.error(f"[AUDIO] Full traceback: {error_traceback}")
+                self.logger.error("[AUDIO] Failed to initialize AudioProcessor: %s", e)
+                self.logger.error("[AUDIO] Error type: %s", type(e).__name__)
+                self.logger.error("[AUDIO] Model causing error: '%s'", model_size)
+                self.logger.error("[AUDIO] Full traceback: %s", error_traceback)
                 
                 print(f"[ERROR] AudioProcessor initialization failed: {e}")
                 print(f"[ERROR] Error type: {type(e).__name__}")
@@ -169,8 +237,8 @@ class AudioRecorder:
                     print(f"  4. Switch to 'base' model in settings to avoid HuggingFace models")
                     print(f"  5. Check settings file: config/settings.json for emoji characters")
                     print(f"========================================\n")
-                    self.logger.error(f"[AUDIO] Unicode encoding error - Windows console cannot handle emojis in model names")
-                    self.logger.error(f"[AUDIO] This is typically caused by [WARNING] prefix added to invalid models in GUI")
+                    self.logger.error("[AUDIO] Unicode encoding error - Windows console cannot handle emojis in model names")
+                    self.logger.error("[AUDIO] This is typically caused by [WARNING] prefix added to invalid models in GUI")
                 elif "/" in model_size:
                     print(f"\n=== HUGGINGFACE MODEL ERROR ===")
                     print(f"[MODEL] HuggingFace model: '{model_size}'")
@@ -180,8 +248,8 @@ class AudioRecorder:
                     print(f"  3. Check model compatibility with faster-whisper")
                     print(f"  4. Verify model exists: https://huggingface.co/{model_size}")
                     print(f"===============================\n")
-                    self.logger.error(f"[AUDIO] HuggingFace model '{model_size}' failed to load")
-                    self.logger.error(f"[AUDIO] Try downloading via GUI or use 'base' model")
+                    self.logger.error("[AUDIO] HuggingFace model '%s' failed to load", model_size)
+                    self.logger.error("[AUDIO] Try downloading via GUI or use 'base' model")
                 else:
                     print(f"\n=== STANDARD MODEL ERROR ===")
                     print(f"[MODEL] Standard model: '{model_size}'")
@@ -190,268 +258,423 @@ class AudioRecorder:
                     print(f"  2. Check faster-whisper installation")
                     print(f"  3. Verify model name is correct")
                     print(f"=============================\n")
-                    self.logger.error(f"[AUDIO] Standard model '{model_size}' failed to load")
+                    self.logger.error("[AUDIO] Standard model '%s' failed to load", model_size)
                 
                 # Log detailed information for debugging
-                self.logger.error(f"[AUDIO] === DEBUGGING INFORMATION ===")
-                self.logger.error(f"[AUDIO] Output directory: {output_dir}")
-                self.logger.error(f"[AUDIO] Enable transcription: {self.enable_transcription}")
-                self.logger.error(f"[AUDIO] Auto paste: {self.auto_paste}")
-                self.logger.error(f"[AUDIO] PROCESSOR_AVAILABLE: {PROCESSOR_AVAILABLE}")
+                self.logger.error("[AUDIO] === DEBUGGING INFORMATION ===")
+                self.logger.error("[AUDIO] Output directory: %s", output_dir)
+                self.logger.error("[AUDIO] Enable transcription: %s", self.enable_transcription)
+                self.logger.error("[AUDIO] Auto paste: %s", self.auto_paste)
+                self.logger.error("[AUDIO] Processor available: %s", processor_available)
                 
                 self.processor = None
                 print(f"[WARNING] Transcription disabled due to model loading error")
                 print(f"[DEBUG] Full error details logged to: logs/voice_recorder_debug.log")
                 print(f"[DEBUG] Check logs/audio_processor.log for AudioProcessor-specific errors")
                 
-        elif self.enable_transcription and not PROCESSOR_AVAILABLE:
-            self.logger.warning(f"[AUDIO] AudioProcessor not available: {_processor_import_error}")
-            print(f"[ERROR] AudioProcessor not available: {_processor_import_error}")
-            print(f"Warning: Transcription disabled - AudioProcessor not available: {_processor_import_error}")
+        elif self.enable_transcription and not processor_available:
+            self.logger.warning("[AUDIO] AudioProcessor not available: %s", processor_import_error)
+            print(f"[ERROR] AudioProcessor not available: {processor_import_error}")
+            print(f"Warning: Transcription disabled - AudioProcessor not available: {processor_import_error}")
             
         elif not self.enable_transcription:
-            self.logger.info("[AUDIO] Transcription disabled by configuration")
-            print("[DEBUG] Transcription disabled by configuration")
+            self.logger.debug("[AUDIO] Transcription disabled by configuration")
         
         self.logger.info("[AUDIO] AudioRecorder initialization complete")
-        self.logger.info(f"[AUDIO] Audio settings - Sample rate: {self.sample_rate}Hz, Channels: {self.channels}, Chunk size: {self.chunk_size}")
-        self.logger.info(f"[AUDIO] Transcription enabled: {self.enable_transcription and self.processor is not None}")
-        self.logger.info(f"[AUDIO] Auto-paste enabled: {self.auto_paste and self.processor is not None and getattr(self.processor, 'paster', None) is not None}")
+        self.logger.debug("[AUDIO] Audio settings - Sample rate: %sHz, Channels: %s, Chunk size: %s", self.sample_rate, self.channels, self.chunk_size)
+        self.logger.debug("[AUDIO] Transcription enabled: %s", self.enable_transcription and self.processor is not None)
+        self.logger.debug("[AUDIO] Silence removal: %s", type(self._speech_gate).__name__ if self._speech_gate else 'disabled')
+        self.logger.debug("[AUDIO] Auto-paste enabled: %s", self.auto_paste and self.processor is not None and getattr(self.processor, 'paster', None) is not None)
     
     def start_recording(self):
-        """Start recording audio in a separate thread."""
+        """Start recording audio from the microphone."""
         with self._thread_lock:
-            if self._recording:
+            if self._recording.is_set():
                 self.logger.warning("[AUDIO] Already recording, ignoring start request")
-                print("Already recording...")
                 return
             
-            self.logger.info("[AUDIO] Starting audio recording")
-            self._recording = True
-            self._frames = []  # Clear previous recording
-            self.logger.info("[AUDIO] Cleared previous recording frames")
+            self.logger.debug("[AUDIO] Starting audio recording")
+            try:
+                self._bytes_written = 0
+                if self.save_wav:
+                    self._open_wav_file()
+            except Exception as e:
+                self.logger.error("[AUDIO] Failed to open recording file: %s", e)
+                return
+            
+            self._recording.set()
+            self._chunk_futures = []
+            if self._executor is not None:
+                # Reason: windows are allocated here, outside the audio callback,
+                # and recycled after transcription, so the callback never
+                # allocates the ~1-4 MB a new window takes
+                while self._windows_allocated < _WINDOW_POOL_SIZE:
+                    self._free_windows.put(self._new_window())
+                    self._windows_allocated += 1
+                if self._window is None:
+                    self._window = self._take_window()
+                self._window_len = 0
+            if self._speech_gate is not None:
+                self._speech_gate.reset()
+            
+            try:
+                self._open_stream()
+            except Exception as e:
+                self.logger.error("[AUDIO] Critical error in recording: %s", e)
+                self._recording.clear()
+                self._close_stream()
+                # Re-probe devices next time, in case the microphone was missing
+                self._terminate_audio()
+                self._discard_wav_file()
+                return
             
-            self._thread = threading.Thread(
-                target=self._record, 
-                daemon=True, 
-                name="AudioRecorder"
-            )
-            self._thread.start()
-            self.logger.info(f"[AUDIO] Recording thread started with ID: {self._thread.ident}")
-            print(f"Recording started... Output will be saved to {self.output_file}")
+            print(f"Recording started... Output will be saved to {self.output_file}" if self.save_wav else "Recording started...")
             
             # Show recording indicator
             if STATUS_INDICATOR_AVAILABLE:
                 try:
                     show_recording()
-                    self.logger.info("[AUDIO] Recording indicator shown")
+                    self.logger.debug("[AUDIO] Recording indicator shown")
                 except Exception as e:
-                    self.logger.error(f"[AUDIO] Failed to show recording indicator: {e}")
+                    self.logger.error("[AUDIO] Failed to show recording indicator: %s", e)
     
     def stop_recording(self):
         """Stop recording and save to file."""
         with self._thread_lock:
-            if not self._recording:
+            if not self._recording.is_set():
                 self.logger.warning("[AUDIO] Not currently recording, ignoring stop request")
-                print("Not currently recording...")
                 return
             
-            self.logger.info("[AUDIO] Stopping audio recording")
-            self._recording = False
-            
-            # Wait for recording thread to finish
-            if self._thread and self._thread.is_alive():
-                self.logger.info(f"[AUDIO] Waiting for recording thread {self._thread.ident} to finish")
-                self._thread.join(timeout=3.0)
-                
-                if self._thread.is_alive():
-                    self.logger.warning("[AUDIO] Recording thread did not stop gracefully")
-                else:
-                    self.logger.info("[AUDIO] Recording thread stopped successfully")
-            
-            # Save recording
-            self.logger.info("[AUDIO] Saving recorded audio")
-            self._save_recording()
-            print(f"Recording stopped and saved to {self.output_file}")
-            self.logger.info("[AUDIO] Recording stop process complete")
+            self.logger.debug("[AUDIO] Stopping audio recording")
+            self._recording.clear()
+            self._close_stream()
+            self.logger.debug("[AUDIO] Recording ended. Total bytes captured: %s", self._bytes_written)
             
-            # Hide recording indicator, will show transcribing if needed
+            # Hide recording indicator before the transcription worker shows its own
             if STATUS_INDICATOR_AVAILABLE:
                 try:
                     hide_indicator()
-                    self.logger.info("[AUDIO] Recording indicator hidden")
+                    self.logger.debug("[AUDIO] Recording indicator hidden")
                 except Exception as e:
-                    self.logger.error(f"[AUDIO] Failed to hide recording indicator: {e}")
+                    self.logger.error("[AUDIO] Failed to hide recording indicator: %s", e)
+            
+            # Save recording
+            self.logger.debug("[AUDIO] Saving recorded audio")
+            self._save_recording()
+            print(f"Recording stopped and saved to {self.output_file}" if self.save_wav else "Recording stopped.")
+            self.logger.debug("[AUDIO] Recording stop process complete")
+    
+    def _open_stream(self):
+        """
+        Start the input stream in callback mode.
+        
+        Reason: in callback mode PortAudio's native thread hands each buffer
+        to _pa_callback, so no Python thread has to read from (or wait on)
+        the stream while recording.
+        """
+        # Reason: PyAudio() enumerates every audio device (50-200 ms on
+        # PulseAudio), so it is created once and reused by later recordings
+        if self._audio is None:
+            self.logger.debug("[AUDIO] Initializing PyAudio")
+            self._audio = pyaudio.PyAudio()
+            self.logger.debug("[AUDIO] PyAudio initialized successfully")
+        
+        # Open stream
+        self.logger.debug("[AUDIO] Opening audio stream - Format: %s, Channels: %s, Rate: %s", self.format, self.channels, self.sample_rate)
+        self._stream = self._audio.open(
+            format=self.format,
+            channels=self.channels,
+            rate=self.sample_rate,
+            input=True,
+            frames_per_buffer=self.chunk_size,
+            stream_callback=self._pa_callback
+        )
+        self._stream.start_stream()
+        self.logger.debug("[AUDIO] Audio capture running in callback mode")
+    
+    def _close_stream(self):
+        """Stop and close the input stream, keeping PyAudio for the next recording."""
+        self.logger.debug("[AUDIO] Closing audio stream")
+        stream, self._stream = self._stream, None
+        if stream:
+            try:
+                stream.stop_stream()
+                stream.close()
+                self.logger.debug("[AUDIO] Audio stream closed")
+            except Exception as e:
+                self.logger.error("[AUDIO] Error closing stream: %s", e)
     
-    def _record(self):
+    def _terminate_audio(self):
+        """Release PyAudio and its PortAudio session."""
+        audio, self._audio = self._audio, None
+        if audio:
+            try:
+                audio.terminate()
+                self.logger.debug("[AUDIO] PyAudio terminated")
+            except Exception as e:
+                self.logger.error("[AUDIO] Error terminating PyAudio: %s", e)
+    
+    def _pa_callback(self, in_data, frame_count, time_info, status):
+        """
+        Receive a buffer of captured audio from PortAudio.
+        
+        Runs on PortAudio's internal thread and appends the data to the WAV file
+        and the transcription window, dropping silent frames first when the
+        speech gate is enabled.
+        
+        Args:
+            in_data (bytes): Captured audio buffer.
+            frame_count (int): Number of frames in the buffer.
+            time_info (dict): PortAudio timing information (unused).
+            status (int): PortAudio status flags (unused).
+        
+        Returns:
+            tuple: No output data and the flag to keep the stream running.
         """
-        Record audio from microphone in dedicated thread.
+        # Reason: streaming to disk keeps memory use at one buffer instead of
+        # growing with the length of the recording.
+        # Reason: Whisper's cost grows with audio length, so silence is
+        # removed before it reaches the disk or the model.
+        if not self._recording.is_set():
+            return (None, pyaudio.paContinue)
         
-        This method runs the core audio recording loop, handling:
-        - PyAudio initialization and configuration
-        - Audio stream management
-        - Real-time audio data capture
-        - Error handling and recovery
-        - Resource cleanup
+        if self._speech_gate is not None:
+            in_data = self._speech_gate.process(in_data)
+        if not in_data:
+            # Reason: the gate returns nothing only once a pause has outlasted
+            # its hangover, so a window past its target length is cut here,
+            # between words, instead of at a fixed sample count
+            if self._window is not None and self._window_len >= self._chunk_samples:
+                self._submit_chunk()
+            return (None, pyaudio.paContinue)
         
-        The recording continues until _recording flag is set to False.
-        Audio data is stored in _frames list for later processing.
+        self._bytes_written += len(in_data)
+        wav_file = self._wav_file
+        if wav_file is not None:
+            wav_file.write(in_data)
+        
+        # Hand each full window to the transcription worker while recording continues
+        if self._window is not None:
+            self._fill_window(np.frombuffer(in_data, dtype=np.int16))
+        return (None, pyaudio.paContinue)
+    
+    def _fill_window(self, samples):
+        """
+        Copy captured samples into the transcription window.
+        
+        Args:
+            samples (np.ndarray): 16-bit samples from the capture callback.
         """
-        self.logger.info("[AUDIO] Entering recording thread")
+        # Reason: copying into one contiguous preallocated array avoids growing
+        # a buffer per callback and gives Whisper a contiguous int16 block.
+        # Windows are normally cut at a pause (see _pa_callback); one that
+        # fills its overrun without a pause is cut here as a last resort.
+        while samples.size:
+            capacity = self._window.size
+            count = min(samples.size, capacity - self._window_len)
+            self._window[self._window_len:self._window_len + count] = samples[:count]
+            self._window_len += count
+            samples = samples[count:]
+            if self._window_len == capacity:
+                self._submit_chunk()
+    
+    def _new_window(self):
+        """Allocate an empty transcription window."""
+        return np.empty(self._chunk_samples + self._overrun_samples, dtype=np.int16)
+    
+    def _take_window(self):
+        """
+        Get an empty transcription window from the pool.
         
+        Returns:
+            np.ndarray: A recycled window, or a new one if the worker still
+            holds every pooled window.
+        """
         try:
-            # Initialize PyAudio
-            self.logger.info("[AUDIO] Initializing PyAudio")
-            self._audio = pyaudio.PyAudio()
-            self.logger.info("[AUDIO] PyAudio initialized successfully")
-            
-            # Open stream
-            self.logger.info(f"[AUDIO] Opening audio stream - Format: {self.format}, Channels: {self.channels}, Rate: {self.sample_rate}")
-            self._stream = self._audio.open(
-                format=self.format,
-                channels=self.channels,
-                rate=self.sample_rate,
-                input=True,
-                frames_per_buffer=self.chunk_size
-            )
-            self.logger.info("[AUDIO] Audio stream opened successfully")
-            
-            print("Recording audio...")
-            self.logger.info("[AUDIO] Starting audio capture loop")
-            
-            frame_count = 0
-            # Record audio chunks
-            while self._recording:
-                try:
-                    data = self._stream.read(self.chunk_size, exception_on_overflow=False)
-                    self._frames.append(data)
-                    frame_count += 1
-                    
-                    if frame_count % 100 == 0:  # Log every 100 frames (~1 second at 16kHz)
-                        self.logger.debug(f"[AUDIO] Captured {frame_count} frames")
-                        
-                except Exception as e:
-                    self.logger.error(f"[AUDIO] Error reading audio chunk: {e}")
-                    break
-            
-            self.logger.info(f"[AUDIO] Recording loop ended. Total frames captured: {frame_count}")
-            
-        except Exception as e:
-            self.logger.error(f"[AUDIO] Critical error in recording: {e}")
-            print(f"Error initializing audio: {e}")
-            self._recording = False
+            return self._free_windows.get_nowait()
+        except queue.Empty:
+            self.logger.debug("[AUDIO] Transcription window pool exhausted, allocating another")
+            return self._new_window()
+    
+    def _recycle_window(self, future, window):
+        """
+        Return a window to the pool once the worker is done reading it.
         
-        finally:
-            # Clean up
-            self.logger.info("[AUDIO] Cleaning up audio resources")
-            if self._stream:
-                try:
-                    self._stream.stop_stream()
-                    self._stream.close()
-                    self.logger.info("[AUDIO] Audio stream closed")
-                except Exception as e:
-                    self.logger.error(f"[AUDIO] Error closing stream: {e}")
-                    
-            if self._audio:
-                try:
-                    self._audio.terminate()
-                    self.logger.info("[AUDIO] PyAudio terminated")
-                except Exception as e:
-                    self.logger.error(f"[AUDIO] Error terminating PyAudio: {e}")
-            
-            self.logger.info("[AUDIO] Recording thread ending")
+        Args:
+            future (Future): Transcription future that reads the window.
+            window (np.ndarray): The full window array (not a slice of it).
+        """
+        future.add_done_callback(lambda _: self._free_windows.put(window))
+    
+    def _submit_chunk(self):
+        """Queue the current audio window for transcription and start a new one."""
+        filled = self._window
+        window = filled[:self._window_len]
+        # The worker keeps reading the filled window, so continue in another one
+        self._window = self._take_window()
+        self._window_len = 0
+        
+        index = len(self._chunk_futures)
+        previous = self._chunk_futures[-1] if self._chunk_futures else None
+        self.logger.debug("[AUDIO] Queueing chunk %s for transcription (%s samples)", index, window.size)
+        future = self._executor.submit(self._transcribe_chunk, window, f"chunk {index}", previous)
+        self._recycle_window(future, filled)
+        self._chunk_futures.append(future)
+    
+    def _transcribe_chunk(self, window, label: str, previous) -> Optional[str]:
+        """
+        Transcribe one window of a recording, using the previous window's text as context.
+        
+        Args:
+            window (np.ndarray): int16 samples of this window.
+            label (str): Name used for this window in the printed results.
+            previous (Optional[Future]): Transcription future of the window before this one.
+        
+        Returns:
+            Optional[str]: The transcribed text, or None if transcription failed.
+        """
+        # Reason: the single worker runs windows in order, so the previous one
+        # is already done; its text lets Whisper carry words and spelling
+        # across the cut instead of starting every window cold.
+        prompt = previous.result() if previous is not None else None
+        return self.processor.transcribe_pcm(window, label, prompt or None)
+    
+    def _wav_header(self, data_size: int) -> bytes:
+        """
+        Build the WAV header for PCM audio of the given size.
+        
+        Args:
+            data_size (int): Size of the PCM payload in bytes.
+        
+        Returns:
+            bytes: The 44-byte RIFF/WAVE header.
+        """
+        block_align = self.channels * self._sampwidth
+        return _WAV_HEADER.pack(
+            b'RIFF', 36 + data_size, b'WAVE',
+            b'fmt ', 16, 1, self.channels, self.sample_rate,
+            self._bytes_per_second, block_align, self._sampwidth * 8,
+            b'data', data_size
+        )
+    
+    def _open_wav_file(self):
+        """
+        Open the temporary WAV file that captured audio is streamed into.
+        
+        The file is created next to the final output so it can be moved into
+        place atomically once the recording stops.
+        """
+        try:
+            temp_fd, temp_path = tempfile.mkstemp(suffix='.wav', dir=self._output_dir, prefix='temp_recording_')
+        except FileNotFoundError:
+            # The output directory is created in __init__; recreate it if it was removed since
+            os.makedirs(self._output_dir, exist_ok=True)
+            temp_fd, temp_path = tempfile.mkstemp(suffix='.wav', dir=self._output_dir, prefix='temp_recording_')
+        self.logger.debug("[AUDIO] Created temporary file: %s", temp_path)
+        
+        # Reason: the header is written by hand (sizes patched on close) so
+        # each captured buffer is a plain file write with no wave module work;
+        # the larger buffer batches ~60 callbacks into each write() syscall.
+        wav_file = os.fdopen(temp_fd, 'wb', buffering=_WAV_BUFFER_SIZE)
+        wav_file.write(self._wav_header(0))
+        
+        self._temp_path = temp_path
+        self._bytes_written = 0
+        self._wav_file = wav_file
     
     def _save_recording(self):
         """
-        Save recorded frames to WAV file with proper formatting.
+        Finish a recording: save the WAV file and start transcription.
         
-        This method handles the complete file saving workflow:
-        - Directory creation if needed
-        - WAV file format configuration (16-bit, 16kHz, mono)
-        - Audio data concatenation and writing
+        This method handles the complete end-of-recording workflow:
         - Duration calculation and logging
-        - Automatic transcription initiation if enabled
+        - Queueing the last audio window and combining the transcription
+        - Finalizing the streamed WAV file when save_wav is enabled
         
-        The saved file follows WAV format standards and is immediately
-        available for transcription processing.
+        Transcription works from the in-memory window, so it does not wait
+        for (or depend on) the WAV file.
         """
-        self.logger.info("[AUDIO] Starting save process")
+        self.logger.debug("[AUDIO] Starting save process")
         
-        if not self._frames:
+        if not self._bytes_written:
             self.logger.warning("[AUDIO] No audio data to save")
-            print("No audio data to save.")
+            self._discard_wav_file()
             return
         
-        self.logger.info(f"[AUDIO] Saving {len(self._frames)} frames to {self.output_file}")
+        # Calculate recording duration
+        duration = self._bytes_written / self._bytes_per_second
+        self.logger.debug("[AUDIO] Recording duration: %.2f seconds", duration)
         
-        try:
-            # Ensure directory exists
-            output_dir = os.path.dirname(self.output_file)
-            if output_dir:
-                os.makedirs(output_dir, exist_ok=True)
-                self.logger.info(f"[AUDIO] Ensured directory exists: {output_dir}")
-            
-            # Calculate recording duration
-            duration = len(self._frames) * self.chunk_size / self.sample_rate
-            self.logger.info(f"[AUDIO] Recording duration: {duration:.2f} seconds")
-            
-            # Create temporary file in same directory as target
-            output_dir = os.path.dirname(self.output_file) if os.path.dirname(self.output_file) else '.'
-            temp_fd, temp_path = tempfile.mkstemp(suffix='.wav', dir=output_dir, prefix='temp_recording_')
-            self.logger.info(f"[AUDIO] Created temporary file: {temp_path}")
-            
+        # Start transcription first so it never waits on the WAV file's disk I/O
+        if self.processor is not None and self._executor is not None:
+            tail = None
+            window, self._window = self._window, None
+            if self._window_len:
+                tail = window[:self._window_len]
+                self._window_len = 0
+            self.logger.debug("[AUDIO] Starting in-memory transcription (%s chunks already queued)", len(self._chunk_futures))
+            future = self._executor.submit(self._transcribe_recording, tail, self._chunk_futures)
+            self._recycle_window(future, window)
+            self._chunk_futures = []
+        else:
+            self.logger.debug("[AUDIO] No processor available - skipping transcription")
+        
+        if self.save_wav:
             try:
-                # Write to temporary file
-                self.logger.info("[AUDIO] Opening temporary WAV file for writing")
-                with os.fdopen(temp_fd, 'wb') as temp_file:
-                    with wave.open(temp_file, 'wb') as wf:
-                        wf.setnchannels(self.channels)
-                        wf.setsampwidth(pyaudio.get_sample_size(self.format))
-                        wf.setframerate(self.sample_rate)
-                        
-                        # Join and write frames
-                        audio_data = b''.join(self._frames)
-                        wf.writeframes(audio_data)
-                        self.logger.info(f"[AUDIO] Written {len(audio_data)} bytes to temporary WAV file")
-                
-                # Now atomically move temp file to final location
-                self.logger.info(f"[AUDIO] Moving {temp_path} to {self.output_file}")
-                shutil.move(temp_path, self.output_file)
-                self.logger.info(f"[AUDIO] File moved successfully to: {self.output_file}")
-                
+                self._finalize_wav_file()
+                self.logger.debug("[AUDIO] Audio saved: %s bytes, approximately %.2f seconds", self._bytes_written, duration)
             except Exception as e:
-                # Clean up temp file if something goes wrong
-                self.logger.error(f"[AUDIO] Error during file save: {e}")
-                if os.path.exists(temp_path):
-                    try:
-                        os.unlink(temp_path)
-                        self.logger.info(f"[AUDIO] Cleaned up temporary file: {temp_path}")
-                    except:
-                        pass
-                raise
-            
-            self.logger.info(f"[AUDIO] File saved successfully: {self.output_file}")
-            print(f"Audio saved: {len(self._frames)} frames, approximately {duration:.2f} seconds")
+                self.logger.error("[AUDIO] Error saving recording: %s", e)
+    
+    def _finalize_wav_file(self):
+        """
+        Patch the WAV header sizes and move the file to the output path.
+        
+        The saved file follows WAV format standards and is moved into place
+        atomically once complete.
+        """
+        wav_file, self._wav_file = self._wav_file, None
+        temp_path, self._temp_path = self._temp_path, None
+        if wav_file is None:
+            self.logger.warning("[AUDIO] No recording file open")
+            return
+        
+        with wav_file:
+            wav_file.seek(0)
+            wav_file.write(self._wav_header(self._bytes_written))
+        
+        try:
+            # Now atomically move temp file to final location
+            # Reason: os.replace is a rename that overwrites on every platform;
+            # shutil.move falls back to copying the whole file on Windows when
+            # the previous recording is still at the output path
+            self.logger.debug("[AUDIO] Moving %s to %s", temp_path, self.output_file)
+            os.replace(temp_path, self.output_file)
+            self.logger.debug("[AUDIO] File saved successfully: %s", self.output_file)
             
-            # Start transcription immediately if processor is available
-            if self.processor is not None:
-                self.logger.info("[AUDIO] Starting direct transcription")
-                print("[DEBUG] Starting direct transcription")
-                transcription_thread = threading.Thread(
-                    target=self._transcribe_recording,
-                    args=(self.output_file,),
-                    daemon=True,
-                    name=f"Transcribe-{os.path.basename(self.output_file)}"
-                )
-                transcription_thread.start()
-                self.logger.info(f"[AUDIO] Transcription thread started with ID: {transcription_thread.ident}")
-            else:
-                self.logger.info("[AUDIO] No processor available - skipping transcription")
-                print("[DEBUG] No processor available - skipping transcription")
+        except Exception as e:
+            # Clean up temp file if something goes wrong
+            self.logger.error("[AUDIO] Error during file save: %s", e)
+            if os.path.exists(temp_path):
+                try:
+                    os.unlink(temp_path)
+                    self.logger.debug("[AUDIO] Cleaned up temporary file: %s", temp_path)
+                except:
+                    pass
+            raise
+    
+    def _discard_wav_file(self):
+        """Close and delete the temporary WAV file of an empty recording."""
+        wav_file, self._wav_file = self._wav_file, None
+        temp_path, self._temp_path = self._temp_path, None
+        if wav_file is None:
+            return
         
+        try:
+            wav_file.close()
+            os.unlink(temp_path)
         except Exception as e:
-            self.logger.error(f"[AUDIO] Error saving recording: {e}")
-            print(f"Error saving recording: {e}")
+            self.logger.error("[AUDIO] Error removing temporary file %s: %s", temp_path, e)
     
     def is_recording(self) -> bool:
         """
@@ -460,9 +683,9 @@ class AudioRecorder:
         Returns:
             bool: True if recording, False otherwise.
         """
-        with self._thread_lock:
-            self.logger.debug(f"[AUDIO] Recording status requested: {self._recording}")
-            return self._recording
+        # Reason: Event.is_set() is safe without the lock, so status checks from
+        # the hotkey thread never wait behind a start/stop in progress
+        return self._recording.is_set()
     
     def toggle_recording(self, state: bool):
         """
@@ -471,46 +694,67 @@ class AudioRecorder:
         Args:
             state (bool): True to start recording, False to stop.
         """
-        self.logger.info(f"[AUDIO] Toggle recording called with state: {state}")
+        self.logger.debug("[AUDIO] Toggle recording called with state: %s", state)
         
-        if state and not self._recording:
-            self.logger.info("[AUDIO] State is True and not recording - starting recording")
+        recording = self._recording.is_set()
+        if state and not recording:
+            self.logger.debug("[AUDIO] State is True and not recording - starting recording")
             self.start_recording()
-        elif not state and self._recording:
-            self.logger.info("[AUDIO] State is False and currently recording - stopping recording")
+        elif not state and recording:
+            self.logger.debug("[AUDIO] State is False and currently recording - stopping recording")
             self.stop_recording()
         else:
-            self.logger.info(f"[AUDIO] No action needed - state: {state}, recording: {self._recording}")
+            self.logger.debug("[AUDIO] No action needed - state: %s, recording: %s", state, recording)
     
-    def _transcribe_recording(self, file_path: str):
+    def _transcribe_recording(self, tail, futures: list):
         """
-        Transcribe a recording file using the AudioProcessor.
+        Transcribe the end of a recording and paste the text of the whole recording.
         
-        This method runs in a separate thread to avoid blocking the main recording workflow.
+        This method runs on the transcription worker, after every chunk queued
+        while recording, so the futures are already complete when read.
         
         Args:
-            file_path (str): Path to the audio file to transcribe.
+            tail (Optional[np.ndarray]): int16 samples captured since the last full window.
+            futures (list): Transcription futures of earlier windows in recording order.
         """
-        self.logger.info(f"[AUDIO] Starting transcription for: {file_path}")
+        name = os.path.basename(self.output_file)
+        self.logger.debug("[AUDIO] Starting transcription for: %s", name)
+        
+        if STATUS_INDICATOR_AVAILABLE:
+            try:
+                show_transcribing()
+            except Exception as e:
+                self.logger.error("[AUDIO] Failed to show transcribing indicator: %s", e)
         
         try:
-            if self.processor is None:
-                self.logger.warning("[AUDIO] No processor available for transcription")
-                return
+            texts = [future.result() for future in futures]
+            if tail is not None:
+                prompt = texts[-1] if texts else None
+                texts.append(self.processor.transcribe_pcm(tail, name if not futures else f"chunk {len(futures)}", prompt or None))
             
-            # Call the processor's transcribe_file method
-            result = self.processor.transcribe_file(file_path)
+            if any(text is None for text in texts):
+                self.logger.warning("[AUDIO] Transcription returned no result for part of: %s", name)
             
-            if result:
-                self.logger.info(f"[AUDIO] Transcription completed successfully for: {file_path}")
-                print(f"\nTranscription completed for: {os.path.basename(file_path)}")
-            else:
-                self.logger.warning(f"[AUDIO] Transcription returned no result for: {file_path}")
-                print(f"\nTranscription failed for: {os.path.basename(file_path)}")
+            transcribed_text = " ".join(text for text in texts if text)
+            self.logger.debug("[AUDIO] Transcription completed: %s characters", len(transcribed_text))
+            self.processor.paste_text(transcribed_text, name)
                 
         except Exception as e:
-            self.logger.error(f"[AUDIO] Error during transcription of {file_path}: {e}")
-            print(f"\nTranscription error for {os.path.basename(file_path)}: {e}")
+            self.logger.error("[AUDIO] Error during transcription of %s: %s", name, e)
+        finally:
+            if STATUS_INDICATOR_AVAILABLE:
+                try:
+                    hide_indicator()
+                except Exception as e:
+                    self.logger.error("[AUDIO] Failed to hide transcribing indicator: %s", e)
+    
+    def _warm_model(self):
+        """Warm up the Whisper model in the background after it is loaded."""
+        try:
+            self.processor.warm_up()
+            self.logger.debug("[AUDIO] Whisper model warmed up")
+        except Exception as e:
+            self.logger.warning("[AUDIO] Model warm-up failed: %s", e)
     
     def cleanup(self):
         """
@@ -519,7 +763,8 @@ class AudioRecorder:
         self.logger.info("[AUDIO] Starting cleanup process")
         
         # Stop any active recording
-        if self._recording:
+        stopped_recording = self._recording.is_set()
+        if stopped_recording:
             self.logger.info("[AUDIO] Stopping active recording during cleanup")
             self.stop_recording()
         
@@ -534,7 +779,25 @@ class AudioRecorder:
                 else:
                     self.logger.info("[AUDIO] No active monitoring to stop")
             except Exception as e:
-                self.logger.error(f"[AUDIO] Error during processor cleanup: {e}")
+                self.logger.error("[AUDIO] Error during processor cleanup: %s", e)
+        
+        # Drop queued transcription work and let the worker thread exit
+        if self._executor is not None:
+            self.logger.info("[AUDIO] Shutting down transcription worker")
+            if stopped_recording:
+                # Reason: stop_recording() just queued the final dictation (its
+                # windows plus the tail), so let the worker finish it rather than
+                # silently cancelling it
+                self.logger.info("[AUDIO] Waiting for the final transcription to finish")
+                self._executor.shutdown(wait=True)
+            elif sys.version_info >= (3, 9):
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            else:
+                # cancel_futures is not available before Python 3.9
+                self._executor.shutdown(wait=False)
+            self._executor = None
+        
+        self._terminate_audio()
         
         self.logger.info("[AUDIO] Cleanup completed")
     
@@ -0,0 +1,285 @@
+"""
+Audio signal processing helpers for the dictationer project.
+
+This module provides voice activity detection used to drop silence from
+captured audio before it is written to disk and handed to Whisper. WebRTC VAD
+is preferred; an RMS energy gate (compiled with Numba when installed) is used
+as a fallback.
+"""
+
+import abc
+import logging
+import functools
+from collections import deque
+
+# Import WebRTC VAD (optional dependency)
+try:
+    import webrtcvad
+    WEBRTCVAD_AVAILABLE = True
+except ImportError:
+    WEBRTCVAD_AVAILABLE = False
+
+# Import NumPy for the energy gate (installed with faster-whisper)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+def _rms_mask_numpy(samples, frame_len, threshold):
+    """
+    Flag frames whose RMS level exceeds a threshold.
+    
+    Args:
+        samples (np.ndarray): 16-bit mono PCM samples.
+        frame_len (int): Samples per frame.
+        threshold (float): RMS level (in int16 units) that counts as sound.
+    
+    Returns:
+        np.ndarray: Boolean mask with one entry per complete frame.
+    """
+    n_frames = samples.shape[0] // frame_len
+    frames = samples[:n_frames * frame_len].reshape(n_frames, frame_len).astype(np.float64)
+    return np.sqrt(np.mean(frames * frames, axis=1)) > threshold
+
+
+@functools.lru_cache(maxsize=1)
+def _get_rms_mask():
+    """
+    Get the RMS frame classifier, compiling it with Numba on first use.
+    
+    Reason: importing Numba and compiling the kernel takes noticeable time,
+    and the energy gate is only a fallback for when webrtcvad is missing, so
+    only that path pays for it. With explicit signatures Numba compiles here
+    (and caches the machine code on disk) rather than on the first recording.
+    
+    Returns:
+        callable: rms_mask(samples, frame_len, threshold) -> np.ndarray, the
+        Numba kernel when Numba is installed, otherwise a NumPy version.
+    """
+    try:
+        from numba import njit, types
+    except ImportError:
+        return _rms_mask_numpy
+    
+    # Audio is always int16 mono; np.frombuffer over bytes yields a read-only array
+    signatures = [
+        types.Array(types.boolean, 1, 'C')(
+            types.Array(types.int16, 1, 'C', readonly=readonly), types.int64, types.float64
+        )
+        for readonly in (True, False)
+    ]
+    
+    @njit(signatures, cache=True, fastmath=True)
+    def rms_mask(samples, frame_len, threshold):
+        """Flag frames whose RMS level exceeds a threshold (see _rms_mask_numpy)."""
+        n_frames = samples.shape[0] // frame_len
+        mask = np.empty(n_frames, dtype=np.bool_)
+        for i in range(n_frames):
+            base = i * frame_len
+            acc = 0.0
+            for j in range(frame_len):
+                # Reason: widen before squaring so int16 samples cannot overflow
+                x = np.float64(samples[base + j])
+                acc += x * x
+            mask[i] = np.sqrt(acc / frame_len) > threshold
+        return mask
+    
+    return rms_mask
+
+
+class _FrameGate(abc.ABC):
+    """
+    Base class for streaming gates that keep sound and drop silence.
+    
+    Audio is classified in fixed-length frames. A short pre-roll of silent
+    frames is kept before sound starts and a hangover after it ends so word
+    onsets and tails are not clipped. Subclasses implement _classify.
+    
+    Attributes:
+        sample_rate (int): Sample rate of the 16-bit mono input in Hz.
+        frame_bytes (int): Size of one classification frame in bytes.
+    """
+    
+    def __init__(self, sample_rate: int, frame_ms: int, padding_ms: int):
+        """
+        Initialize the frame gate.
+        
+        Args:
+            sample_rate (int): Input sample rate in Hz.
+            frame_ms (int): Classification frame length in ms.
+            padding_ms (int): Silence kept before and after sound in ms.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.sample_rate = sample_rate
+        self.frame_bytes = sample_rate * frame_ms // 1000 * 2  # 16-bit samples
+        
+        self._padding_frames = max(1, padding_ms // frame_ms)
+        self._pending = bytearray()
+        self._out = bytearray()  # Reused output buffer, grown on demand
+        self._pre_roll = deque(maxlen=self._padding_frames)
+        self._hangover = 0
+    
+    def reset(self):
+        """Clear buffered state before a new recording."""
+        self._pending.clear()
+        self._pre_roll.clear()
+        self._hangover = 0
+    
+    @abc.abstractmethod
+    def _classify(self, data: memoryview) -> list:
+        """
+        Classify each complete frame in the data.
+        
+        Args:
+            data (memoryview): Audio whose length is a multiple of frame_bytes.
+        
+        Returns:
+            list: One boolean per frame, True when the frame contains sound.
+        """
+    
+    def process(self, data: bytes) -> memoryview:
+        """
+        Filter a chunk of captured audio.
+        
+        Incomplete trailing frames are buffered until the next call.
+        
+        The result is a view into a buffer that is reused across calls, so
+        callers must consume it (write it out or copy it) before the next
+        call to process(); holding on to it returns overwritten audio.
+        
+        Args:
+            data (bytes): 16-bit mono PCM audio.
+        
+        Returns:
+            memoryview: The audio that contains sound (with padding), possibly
+            empty. It is only valid until the next call.
+        """
+        frame_bytes = self.frame_bytes
+        
+        # Only go through the pending buffer when a partial frame is carried
+        # over; callbacks sized in whole frames are classified in place
+        if self._pending:
+            self._pending.extend(data)
+            data = bytes(self._pending)
+            self._pending.clear()
+        
+        usable = len(data) - len(data) % frame_bytes
+        view = memoryview(data)
+        if usable < len(data):
+            self._pending.extend(view[usable:])
+        if not usable:
+            return view[:0]
+        
+        # Reason: output is copied into one buffer that is reused across calls,
+        # so steady-state capture allocates nothing per callback
+        needed = usable + len(self._pre_roll) * frame_bytes
+        if len(self._out) < needed:
+            self._out = bytearray(needed)
+        out = self._out
+        end = 0
+        
+        # Reason: memoryview slices share the callback's buffer, so splitting
+        # it into frames allocates no new byte strings
+        chunk = view[:usable]
+        for index, has_sound in enumerate(self._classify(chunk)):
+            frame = chunk[index * frame_bytes:(index + 1) * frame_bytes]
+            if has_sound:
+                # Sound onset: flush the pre-roll so the first syllable is kept
+                for padded in self._pre_roll:
+                    out[end:end + frame_bytes] = padded
+                    end += frame_bytes
+                self._pre_roll.clear()
+                out[end:end + frame_bytes] = frame
+                end += frame_bytes
+                self._hangover = self._padding_frames
+            elif self._hangover:
+                out[end:end + frame_bytes] = frame
+                end += frame_bytes
+                self._hangover -= 1
+            else:
+                self._pre_roll.append(frame)
+        
+        return memoryview(out)[:end]
+
+
+class SpeechGate(_FrameGate):
+    """Speech gate backed by the WebRTC voice activity detector."""
+    
+    def __init__(self, sample_rate: int = 16000, frame_ms: int = 30,
+                 aggressiveness: int = 2, padding_ms: int = 300):
+        """
+        Initialize the speech gate.
+        
+        Args:
+            sample_rate (int): Input sample rate in Hz (8000, 16000, 32000 or 48000).
+            frame_ms (int): Classification frame length in ms (10, 20 or 30).
+            aggressiveness (int): WebRTC VAD aggressiveness from 0 to 3.
+            padding_ms (int): Silence kept before and after speech in ms.
+        
+        Raises:
+            RuntimeError: If webrtcvad is not installed.
+        """
+        if not WEBRTCVAD_AVAILABLE:
+            raise RuntimeError("webrtcvad is not installed")
+        
+        super().__init__(sample_rate, frame_ms, padding_ms)
+        self._vad = webrtcvad.Vad(aggressiveness)
+    
+    def _classify(self, data: memoryview) -> list:
+        """Classify frames with WebRTC VAD."""
+        frame_bytes = self.frame_bytes
+        return [
+            self._vad.is_speech(data[offset:offset + frame_bytes], self.sample_rate)
+            for offset in range(0, len(data), frame_bytes)
+        ]
+
+
+class EnergyGate(_FrameGate):
+    """Energy gate that treats frames above an RMS threshold as sound."""
+    
+    def __init__(self, sample_rate: int = 16000, frame_ms: int = 30,
+                 threshold: float = 200.0, padding_ms: int = 300):
+        """
+        Initialize the energy gate.
+        
+        Args:
+            sample_rate (int): Input sample rate in Hz.
+            frame_ms (int): Classification frame length in ms.
+            threshold (float): RMS level in int16 units (200 is about -44 dBFS).
+            padding_ms (int): Silence kept before and after sound in ms.
+        
+        Raises:
+            RuntimeError: If NumPy is not installed.
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("numpy is not installed")
+        
+        super().__init__(sample_rate, frame_ms, padding_ms)
+        self.threshold = float(threshold)
+        self._frame_len = self.frame_bytes // 2
+        self._rms_mask = _get_rms_mask()
+    
+    def _classify(self, data: memoryview) -> list:
+        """Classify frames by RMS level."""
+        samples = np.frombuffer(data, dtype=np.int16)
+        return self._rms_mask(samples, self._frame_len, self.threshold).tolist()
+
+
+def create_silence_gate(sample_rate: int = 16000, frame_ms: int = 30):
+    """
+    Create the best available silence gate.
+    
+    Args:
+        sample_rate (int): Input sample rate in Hz.
+        frame_ms (int): Classification frame length in ms (10, 20 or 30).
+    
+    Returns:
+        Optional[_FrameGate]: A SpeechGate, an EnergyGate, or None if neither
+        webrtcvad nor NumPy is installed.
+    """
+    if WEBRTCVAD_AVAILABLE:
+        return SpeechGate(sample_rate, frame_ms=frame_ms)
+    if NUMPY_AVAILABLE:
+        return EnergyGate(sample_rate, frame_ms=frame_ms)
+    return None
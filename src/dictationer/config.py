@@ -6,37 +6,22 @@ and configuration persistence for the GUI interface.
 """
 
 import os
+import re
+import sys
 import json
 import logging
+import functools
+from types import MappingProxyType
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dotenv import load_dotenv
 
+# orjson parses and serializes several times faster than the json module
 try:
-    import torch
-    TORCH_AVAILABLE = True
-    # Debug: Print torch info when imported
-    import sys
-    print(f"[DEBUG] Using Python from: {sys.executable}")
-    print(f"[DEBUG] PyTorch version: {torch.__version__}")
-    print(f"[DEBUG] PyTorch location: {torch.__file__}")
-    print(f"[DEBUG] CUDA available: {torch.cuda.is_available()}")
-    if torch.cuda.is_available():
-        print(f"[DEBUG] CUDA version: {torch.version.cuda}")
-        print(f"[DEBUG] GPU count: {torch.cuda.device_count()}")
-except ImportError as e:
-    TORCH_AVAILABLE = False
-    torch = None
-    import sys
-    print(f"[DEBUG] Using Python from: {sys.executable}")
-    print(f"[ERROR] PyTorch not available: {e}")
-
-try:
-    from faster_whisper import WhisperModel
-    WHISPER_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    WHISPER_AVAILABLE = False
-    WhisperModel = None
+    ORJSON_AVAILABLE = False
 
 try:
     from .reformatter.gemini import ReformattingMode
@@ -45,6 +30,111 @@ except ImportError:
     REFORMATTER_AVAILABLE = False
     ReformattingMode = None
 
+logger = logging.getLogger(__name__)
+
+
+def _device_preference(value: str) -> str:
+    """Validate a DEVICE_PREFERENCE value."""
+    value = value.strip().lower()
+    if value not in ("auto", "cpu", "gpu"):
+        raise ValueError(f"expected auto, cpu or gpu, got {value!r}")
+    return value
+
+
+def _log_level(value: str) -> str:
+    """Validate a LOG_LEVEL value."""
+    value = value.strip().upper()
+    if not isinstance(logging.getLevelName(value), int):
+        raise ValueError(f"unknown log level {value!r}")
+    return value
+
+
+def _directory(value: str) -> str:
+    """Expand ~ and environment variables in an OUTPUT_DIRECTORY value."""
+    return os.path.expandvars(os.path.expanduser(value))
+
+
+# Environment variables that override settings, as (variable, config key, coercer)
+_ENV_SPEC = (
+    ("DICTATIONER_HOTKEY", "hotkey", str),
+    ("WHISPER_MODEL_SIZE", "whisper_model_size", str.strip),
+    ("OUTPUT_DIRECTORY", "output_directory", _directory),
+    ("DEVICE_PREFERENCE", "device_preference", _device_preference),
+    ("LOG_LEVEL", "log_level", _log_level)
+)
+
+# Last HuggingFace cache scan, as ((hub path, hub mtime), (names, name set))
+_cached_models_cache: Optional[tuple] = None
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON from UTF-8 bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes indented by two spaces."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+@functools.lru_cache(maxsize=1)
+def _load_dotenv_once() -> None:
+    """
+    Load the .env file into the environment on first use.
+    
+    Reason: the file only needs parsing once per process; GUI re-inits and
+    every AudioProcessor create their own ConfigManager.
+    """
+    load_dotenv()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_hub_dir() -> Path:
+    """
+    Get the HuggingFace hub cache directory, resolved once per process.
+    
+    Resolves the variables in the same order as huggingface_hub, so model
+    detection, GUI downloads and the program all use one cache.
+    
+    Returns:
+        Path: HF_HUB_CACHE if set, otherwise the hub directory under HF_HOME
+        (default ~/.cache/huggingface).
+    """
+    hub_cache = os.environ.get("HF_HUB_CACHE") or os.environ.get("HUGGINGFACE_HUB_CACHE")
+    if hub_cache:
+        return Path(hub_cache)
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    hf_home = os.environ.get("HF_HOME") or os.path.join(cache_home, "huggingface")
+    return Path(hf_home) / "hub"
+
+
+@functools.lru_cache(maxsize=1)
+def _get_torch():
+    """
+    Import PyTorch on first use.
+    
+    Reason: importing torch loads the CUDA runtime, which takes seconds and
+    wakes discrete GPUs on laptops, so only GPU detection pays for it and
+    reading settings or listing models never does.
+    
+    Returns:
+        The torch module, or None if PyTorch is not installed.
+    """
+    try:
+        import torch
+    except ImportError as e:
+        logger.warning("PyTorch not available (Python: %s): %s", sys.executable, e)
+        return None
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Using Python from: %s", sys.executable)
+        logger.debug("PyTorch version: %s (%s)", torch.__version__, torch.__file__)
+    return torch
+
 
 class DeviceDetector:
     """
@@ -54,61 +144,128 @@ class DeviceDetector:
     the best device for processing tasks.
     """
     
+    __slots__ = ()  # Stateless: only static methods
+    
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def detect_gpu() -> bool:
         """
         Detect if GPU is available for processing.
         
+        The result is cached, since the GPUs cannot change while the process runs.
+        
         Returns:
-            bool: True if GPU is available and functional, False otherwise.
+            bool: True if a CUDA GPU is available, False otherwise.
         """
-        if not TORCH_AVAILABLE:
+        torch = _get_torch()
+        if torch is None:
             return False
-            
+        
+        # Reason: is_available() already checks the driver and runtime without
+        # creating a CUDA context (tens of MB of VRAM, hundreds of ms, and a
+        # dGPU wake-up on laptops); probe_gpu() does the full test on request
         try:
-            if torch.cuda.is_available():
-                # Test basic GPU functionality
-                device = torch.device('cuda')
-                test_tensor = torch.tensor([1.0], device=device)
-                return True
+            return torch.cuda.is_available()
         except Exception:
-            pass
-            
-        return False
+            return False
+    
+    @staticmethod
+    def probe_gpu() -> bool:
+        """
+        Test that the GPU actually works by allocating a tensor on it.
+        
+        This initializes a CUDA context, so it is only meant for explicit
+        user requests such as the GPU information dialog.
+        
+        Returns:
+            bool: True if a tensor could be created on the GPU, False otherwise.
+        """
+        if not DeviceDetector.detect_gpu():
+            return False
+        
+        torch = _get_torch()
+        try:
+            torch.tensor([1.0], device=torch.device('cuda'))
+            return True
+        except Exception as e:
+            logging.warning(f"GPU functionality test failed: {e}")
+            return False
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _get_static_gpu_info() -> tuple:
+        """
+        Probe the GPUs once for the details that do not change at runtime.
+        
+        Returns:
+            tuple: (available, devices) where devices is a tuple of
+                (index, name, memory_total) tuples.
+        """
+        torch = _get_torch()
+        if torch is None:
+            return False, ()
+        
+        devices = []
+        try:
+            if not torch.cuda.is_available():
+                return False, ()
+            for i in range(torch.cuda.device_count()):
+                # Reason: get_device_name() is itself a properties lookup, so
+                # one query per device provides both fields
+                properties = torch.cuda.get_device_properties(i)
+                devices.append((i, properties.name, properties.total_memory))
+        except Exception as e:
+            logging.warning(f"Error getting GPU info: {e}")
+        
+        return True, tuple(devices)
+    
+    @staticmethod
+    def get_gpu_memory_dynamic(index: int) -> Dict[str, int]:
+        """
+        Get the current PyTorch memory usage of a GPU.
+        
+        Args:
+            index (int): CUDA device index.
+        
+        Returns:
+            Dict[str, int]: Bytes reserved and allocated by PyTorch on the device.
+        """
+        torch = _get_torch()
+        try:
+            return {
+                "memory_reserved": torch.cuda.memory_reserved(index),
+                "memory_allocated": torch.cuda.memory_allocated(index)
+            }
+        except Exception as e:
+            logging.warning(f"Error getting GPU memory usage: {e}")
+            return {"memory_reserved": 0, "memory_allocated": 0}
     
     @staticmethod
     def get_gpu_info() -> Dict[str, Any]:
         """
         Get detailed GPU information.
         
+        Device names and total memory are probed once and reused; only the
+        memory usage figures are read on every call.
+        
         Returns:
             Dict[str, Any]: GPU information including name, memory, etc.
         """
+        available, devices = DeviceDetector._get_static_gpu_info()
         info = {
-            "available": False,
-            "device_count": 0,
+            "available": available,
+            "device_count": len(devices),
             "devices": []
         }
         
-        if not TORCH_AVAILABLE:
-            return info
-            
-        try:
-            if torch.cuda.is_available():
-                info["available"] = True
-                info["device_count"] = torch.cuda.device_count()
-                
-                for i in range(info["device_count"]):
-                    device_info = {
-                        "index": i,
-                        "name": torch.cuda.get_device_name(i),
-                        "memory_total": torch.cuda.get_device_properties(i).total_memory,
-                        "memory_reserved": torch.cuda.memory_reserved(i),
-                        "memory_allocated": torch.cuda.memory_allocated(i)
-                    }
-                    info["devices"].append(device_info)
-        except Exception as e:
-            logging.warning(f"Error getting GPU info: {e}")
+        for index, name, memory_total in devices:
+            device_info = {
+                "index": index,
+                "name": name,
+                "memory_total": memory_total
+            }
+            device_info.update(DeviceDetector.get_gpu_memory_dynamic(index))
+            info["devices"].append(device_info)
             
         return info
 
@@ -121,7 +278,11 @@ class ConfigManager:
     with support for environment variables and persistent storage.
     """
     
-    DEFAULT_CONFIG = {
+    __slots__ = ("logger", "config_file", "config", "_last_mtime_ns", "_file_config", "_last_serialized",
+                 "_dir_ensured")
+    
+    # Read-only so the shared defaults cannot be modified by accident; copy with dict()
+    DEFAULT_CONFIG = MappingProxyType({
         "device_preference": "auto",  # auto, cpu, gpu
         "whisper_model_size": "base",
         "hotkey": "ctrl+win+shift+l",
@@ -132,7 +293,7 @@ class ConfigManager:
         "enable_reformatter": False,           # Master on/off switch
         # Mode removed - always uses grammar_fix internally
         "reformatter_hold_duration": 2.0      # Ctrl hold time in seconds
-    }
+    })
     
     def __init__(self, config_file: Optional[str] = None):
         """
@@ -145,16 +306,24 @@ class ConfigManager:
         self.logger = logging.getLogger(__name__)
         
         # Load environment variables
-        load_dotenv()
+        _load_dotenv_once()
         
         # Set config file path
+        self._dir_ensured = False  # Whether the config directory is known to exist
         if config_file is None:
             config_dir = Path("config")
-            config_dir.mkdir(exist_ok=True)
+            try:
+                config_dir.mkdir()
+            except FileExistsError:
+                pass
+            self._dir_ensured = True
             config_file = config_dir / "settings.json"
         
         self.config_file = Path(config_file)
-        self.config = self.DEFAULT_CONFIG.copy()
+        self.config = dict(self.DEFAULT_CONFIG)
+        self._last_mtime_ns: Optional[int] = None  # Config file mtime at the last parse
+        self._file_config: Dict[str, Any] = {}  # Settings read by the last parse
+        self._last_serialized: Optional[bytes] = None  # File content as of _last_mtime_ns
         
         # Load existing configuration
         self.load_config()
@@ -169,16 +338,30 @@ class ConfigManager:
         Returns:
             Dict[str, Any]: Loaded configuration dictionary.
         """
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r') as f:
-                    file_config = json.load(f)
-                    self.config.update(file_config)
-                    self.logger.info(f"Configuration loaded from {self.config_file}")
-            except Exception as e:
-                self.logger.error(f"Error loading config: {e}")
-        else:
+        try:
+            mtime_ns = self.config_file.stat().st_mtime_ns
+        except OSError:
             self.logger.info("No config file found, using defaults")
+            return self.config
+        
+        try:
+            # Reason: an unchanged mtime means the same content, so the last
+            # parse is applied again instead of reading and parsing the file
+            if mtime_ns != self._last_mtime_ns:
+                data = self.config_file.read_bytes()
+                # Reason: interned keys and enum-like values ("auto", "cpu",
+                # "INFO") are shared with the literals they are compared to,
+                # so reloads do not leave duplicate string objects behind
+                self._file_config = {
+                    sys.intern(key): sys.intern(value) if isinstance(value, str) else value
+                    for key, value in _loads(data).items()
+                }
+                self._last_mtime_ns = mtime_ns
+                self._last_serialized = data
+            self.config.update(self._file_config)
+            self.logger.info(f"Configuration loaded from {self.config_file}")
+        except Exception as e:
+            self.logger.error(f"Error loading config: {e}")
             
         return self.config
     
@@ -186,15 +369,41 @@ class ConfigManager:
         """
         Save current configuration to file.
         
+        The file is left untouched when it already holds the same settings,
+        so saving repeatedly does not rewrite it or wake file watchers.
+        
         Returns:
             bool: True if save was successful, False otherwise.
         """
         try:
-            # Ensure config directory exists
-            self.config_file.parent.mkdir(parents=True, exist_ok=True)
+            new_bytes = _dumps(self.config)
+            if self._is_saved(new_bytes):
+                self.logger.debug("Configuration unchanged, skipping write")
+                return True
             
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            # Ensure config directory exists (once per manager)
+            if not self._dir_ensured:
+                self.config_file.parent.mkdir(parents=True, exist_ok=True)
+                self._dir_ensured = True
+            
+            # Reason: writing a temporary file and renaming it over the settings
+            # means a crash mid-write can never leave a truncated settings.json
+            temp_file = self.config_file.with_suffix(self.config_file.suffix + ".tmp")
+            try:
+                with open(temp_file, 'wb') as f:
+                    f.write(new_bytes)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_file, self.config_file)
+            except BaseException:
+                try:
+                    temp_file.unlink()
+                except OSError:
+                    pass
+                raise
+            self._last_mtime_ns = self.config_file.stat().st_mtime_ns
+            self._last_serialized = new_bytes
+            self._file_config = dict(self.config)
             
             self.logger.info(f"Configuration saved to {self.config_file}")
             return True
@@ -203,6 +412,27 @@ class ConfigManager:
             self.logger.error(f"Error saving config: {e}")
             return False
     
+    def _is_saved(self, data: bytes) -> bool:
+        """
+        Check whether the config file already contains exactly this data.
+        
+        Args:
+            data (bytes): Serialized configuration.
+        
+        Returns:
+            bool: True if the file content equals data.
+        """
+        try:
+            mtime_ns = self.config_file.stat().st_mtime_ns
+        except OSError:
+            return False
+        
+        # Reason: if the file has not changed since it was last read or
+        # written, compare against that content instead of reading it again
+        if mtime_ns == self._last_mtime_ns and self._last_serialized is not None:
+            return data == self._last_serialized
+        return self.config_file.read_bytes() == data
+    
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get configuration value.
@@ -236,9 +466,21 @@ class ConfigManager:
         Returns:
             Dict[str, Any]: Device configuration including detection results.
         """
-        device_info = DeviceDetector.get_gpu_info()
         preference = self.get("device_preference", "auto")
         
+        # Reason: a CPU-only preference never needs the GPU details, so it
+        # skips importing torch and probing CUDA altogether
+        if preference == "cpu":
+            return {
+                "preference": preference,
+                "gpu_available": False,
+                "gpu_info": {"available": False, "device_count": 0, "devices": []},
+                "use_gpu": False,
+                "device": "cpu"
+            }
+        
+        device_info = DeviceDetector.get_gpu_info()
+        
         # Determine actual device to use
         if preference == "auto":
             use_gpu = device_info["available"]
@@ -257,23 +499,18 @@ class ConfigManager:
     
     def _load_env_overrides(self) -> None:
         """Load configuration overrides from environment variables."""
-        env_mapping = {
-            "DICTATIONER_HOTKEY": "hotkey",
-            "WHISPER_MODEL_SIZE": "whisper_model_size",
-            "OUTPUT_DIRECTORY": "output_directory",
-            "DEVICE_PREFERENCE": "device_preference",
-            "LOG_LEVEL": "log_level"
-        }
-        
-        for env_key, config_key in env_mapping.items():
-            env_value = os.getenv(env_key)
-            if env_value is not None:
-                # Convert boolean strings
-                if env_value.lower() in ('true', 'false'):
-                    env_value = env_value.lower() == 'true'
-                
-                self.config[config_key] = env_value
-                self.logger.debug(f"Config override from env: {config_key} = {env_value}")
+        env = os.environ
+        for env_key, config_key, coerce in _ENV_SPEC:
+            env_value = env.get(env_key)
+            if env_value is None:
+                continue
+            
+            try:
+                self.config[config_key] = coerce(env_value)
+            except ValueError as e:
+                self.logger.warning(f"Ignoring invalid {env_key}: {e}")
+                continue
+            self.logger.debug("Config override from env: %s = %s", config_key, self.config[config_key])
 
 
 def get_default_config() -> ConfigManager:
@@ -293,96 +530,196 @@ class ModelDetector:
     Provides methods to detect cached models and available downloadable models.
     """
     
+    __slots__ = ()  # Stateless: only static methods
+    
+    # Standard Whisper model sizes and the CTranslate2 repos faster-whisper
+    # downloads them from (as in faster_whisper.utils.download_model)
+    STANDARD_MODEL_REPOS = MappingProxyType({
+        "tiny": "Systran/faster-whisper-tiny",
+        "tiny.en": "Systran/faster-whisper-tiny.en",
+        "base": "Systran/faster-whisper-base",
+        "base.en": "Systran/faster-whisper-base.en",
+        "small": "Systran/faster-whisper-small",
+        "small.en": "Systran/faster-whisper-small.en",
+        "medium": "Systran/faster-whisper-medium",
+        "medium.en": "Systran/faster-whisper-medium.en",
+        "large": "Systran/faster-whisper-large-v3",
+        "large-v1": "Systran/faster-whisper-large-v1",
+        "large-v2": "Systran/faster-whisper-large-v2",
+        "large-v3": "Systran/faster-whisper-large-v3",
+        "large-v3-turbo": "mobiuslabsgmbh/faster-whisper-large-v3-turbo",
+        "turbo": "mobiuslabsgmbh/faster-whisper-large-v3-turbo",
+        "distil-small.en": "Systran/faster-distil-whisper-small.en",
+        "distil-medium.en": "Systran/faster-distil-whisper-medium.en",
+        "distil-large-v2": "Systran/faster-distil-whisper-large-v2",
+        "distil-large-v3": "Systran/faster-distil-whisper-large-v3"
+    })
+    
     # Standard Whisper model sizes (supported by faster-whisper)
-    STANDARD_MODELS = [
-        "tiny", "tiny.en", "base", "base.en", "small", "small.en", 
-        "medium", "medium.en", "large", "large-v1", "large-v2", "large-v3",
-        "distil-small.en", "distil-medium.en", "distil-large-v2", "distil-large-v3"
-    ]
-    
-    # Recommended downloadable models
-    DOWNLOADABLE_MODELS = [
-        {
+    STANDARD_MODELS = list(STANDARD_MODEL_REPOS)
+    
+    # HuggingFace cache directories: models--org--model-name
+    _HF_DIR_RE = re.compile(r"models--(.+)")
+    
+    # Reason: one compiled alternation scans a directory name once instead of
+    # a substring search per model; longest names come first so a directory
+    # named for "large-v3" or "tiny.en" is not reported as "large" or "tiny"
+    _STANDARD_MODEL_RE = re.compile(
+        "|".join(re.escape(m) for m in sorted(STANDARD_MODELS, key=len, reverse=True))
+    )
+    
+    # Recommended downloadable models (read-only, shared with callers)
+    DOWNLOADABLE_MODELS = (
+        MappingProxyType({
             "name": "openai/whisper-large-v3-turbo",
             "display_name": "Whisper Large V3 Turbo",
             "url": "https://huggingface.co/openai/whisper-large-v3-turbo",
             "description": "Latest OpenAI Whisper model - fastest large model",
             "type": "huggingface"
-        },
-        {
+        }),
+        MappingProxyType({
             "name": "distil-whisper/distil-large-v3", 
             "display_name": "Distil Whisper Large V3",
             "url": "https://huggingface.co/distil-whisper/distil-large-v3",
             "description": "Distilled version - faster inference, good quality",
             "type": "huggingface"
-        }
-    ]
+        })
+    )
+    
+    @staticmethod
+    def resolve_repo_id(model_name: str) -> str:
+        """
+        Map a model name to the HuggingFace repo faster-whisper loads it from.
+        
+        Args:
+            model_name (str): A standard size such as "base", or a repo ID.
+        
+        Returns:
+            str: The HuggingFace repo ID.
+        
+        Raises:
+            ValueError: If model_name is neither a repo ID nor a standard size.
+        """
+        if "/" in model_name:
+            return model_name
+        
+        try:
+            return ModelDetector.STANDARD_MODEL_REPOS[model_name]
+        except KeyError:
+            raise ValueError(
+                f"Unknown model size '{model_name}'; expected a HuggingFace repo ID "
+                f"(org/name) or one of: {', '.join(ModelDetector.STANDARD_MODELS)}"
+            ) from None
     
     @staticmethod
     def get_cached_models() -> list:
         """
         Get list of cached Whisper models by checking the HuggingFace cache directory.
         
+        The directory scan is reused until a model is added to or removed
+        from the cache, so repeated calls only cost one stat().
+        
         Returns:
             list: List of cached model names.
         """
-        cached_models = []
+        return list(ModelDetector._get_cached_model_index()[0])
+    
+    @staticmethod
+    def _get_cached_model_index() -> tuple:
+        """
+        Scan the HuggingFace cache directory, or reuse the last scan if it is unchanged.
+        
+        Returns:
+            tuple: (sorted tuple of cached model names, frozenset of the same names).
+        """
+        global _cached_models_cache
+        cached_models = set()
+        cache_key = None
+        complete = True
         
         try:
-            import os
-            from pathlib import Path
-            
             # Check HuggingFace cache directory
-            cache_dir = os.environ.get("HF_HOME", Path.home() / ".cache" / "huggingface")
-            model_path = Path(cache_dir) / "hub"
+            model_path = _get_hub_dir()
             
-            if not model_path.exists():
-                return cached_models
+            try:
+                hub_mtime_ns = model_path.stat().st_mtime_ns
+            except FileNotFoundError:
+                return (), frozenset()
+            
+            # Reason: adding or removing a model directory updates the hub
+            # directory's mtime, so an unchanged mtime means an unchanged scan
+            cache_key = (str(model_path), hub_mtime_ns)
+            if _cached_models_cache is not None and _cached_models_cache[0] == cache_key:
+                return _cached_models_cache[1]
             
             # Search for model directories
-            for item in model_path.iterdir():
-                if not item.is_dir():
-                    continue
-                
-                dir_name = item.name
-                
-                # Handle HuggingFace cache format: models--org--model-name
-                if "models--" in dir_name and "whisper" in dir_name.lower():
-                    # Extract model name from cache directory
-                    parts = dir_name.replace("models--", "").split("--")
-                    if len(parts) >= 2:
-                        model_name = "/".join(parts)
-                        
-                        # Check if the model has actual files (not just refs)
-                        snapshots_dir = item / "snapshots"
-                        if snapshots_dir.exists() and any(snapshots_dir.iterdir()):
-                            cached_models.append(model_name)
-                
-                # Also check for standard model names that might be cached differently
-                elif any(std_model in dir_name.lower() for std_model in ModelDetector.STANDARD_MODELS):
-                    for std_model in ModelDetector.STANDARD_MODELS:
-                        if std_model in dir_name.lower() and std_model not in cached_models:
-                            # Verify it has actual content
-                            snapshots_dir = item / "snapshots"
-                            if snapshots_dir.exists() and any(snapshots_dir.iterdir()):
-                                cached_models.append(std_model)
-                                break
-        
+            # Reason: scandir entries carry the file type from the directory
+            # listing, so no Path object or extra stat() is needed per entry
+            with os.scandir(model_path) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    
+                    dir_name = entry.name
+                    dir_name_lower = dir_name.lower()
+                    
+                    # Handle HuggingFace cache format: models--org--model-name
+                    hf_match = ModelDetector._HF_DIR_RE.fullmatch(dir_name)
+                    if hf_match is not None:
+                        repo_id = hf_match.group(1)
+                        if "whisper" in dir_name_lower and "--" in repo_id:
+                            # Extract model name from cache directory
+                            model_name = repo_id.replace("--", "/")
+                            
+                            # Check if the model has actual files (not just refs)
+                            if ModelDetector._has_snapshots(entry.path):
+                                cached_models.add(model_name)
+                            else:
+                                # Possibly still downloading - files land without touching the hub mtime
+                                complete = False
+                        continue
+                    
+                    # Also check for standard model names that might be cached differently
+                    std_match = ModelDetector._STANDARD_MODEL_RE.search(dir_name_lower)
+                    if std_match is not None and ModelDetector._has_snapshots(entry.path):
+                        # Verified it has actual content
+                        cached_models.add(std_match.group(0))
+            
         except Exception as e:
             # If there's any error checking cache, just return what we have
-            pass
+            cache_key = None
         
-        return sorted(list(set(cached_models)))  # Remove duplicates and sort
+        index = (tuple(sorted(cached_models)), frozenset(cached_models))
+        if cache_key is not None and complete:
+            _cached_models_cache = (cache_key, index)
+        return index
+    
+    @staticmethod
+    def _has_snapshots(model_dir: str) -> bool:
+        """
+        Check whether a cached model directory holds at least one snapshot.
+        
+        Args:
+            model_dir (str): Model directory in the HuggingFace hub cache.
+        
+        Returns:
+            bool: True if the snapshots directory exists and is not empty.
+        """
+        try:
+            with os.scandir(os.path.join(model_dir, "snapshots")) as snapshots:
+                return next(snapshots, None) is not None
+        except OSError:
+            return False
     
     @staticmethod
-    def get_downloadable_models() -> list:
+    def get_downloadable_models() -> tuple:
         """
         Get list of recommended downloadable models.
         
         Returns:
-            list: List of downloadable model info dictionaries.
+            tuple: Read-only downloadable model info mappings.
         """
-        return ModelDetector.DOWNLOADABLE_MODELS.copy()
+        return ModelDetector.DOWNLOADABLE_MODELS
     
     @staticmethod
     def is_model_cached(model_name: str) -> bool:
@@ -396,8 +733,7 @@ class ModelDetector:
             bool: True if model is cached, False otherwise.
         """
         # Check cache using exact model name - no normalization
-        cached_models = ModelDetector.get_cached_models()
-        return model_name in cached_models
+        return model_name in ModelDetector._get_cached_model_index()[1]
     
     @staticmethod
     def validate_model_compatibility(model_name: str) -> dict:
@@ -7,25 +7,136 @@ Dictationer settings, managing device preferences, and controlling the main prog
 
 import sys
 import os
+import fnmatch
+import functools
+import importlib.util
 import subprocess
 import threading
 import logging
 from pathlib import Path
-from typing import Optional, Dict, Any
+from collections import deque
+from typing import Optional, Dict, Any, List, Tuple, Deque
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QGridLayout, QLabel, QLineEdit, QPushButton, QComboBox, QCheckBox,
-    QGroupBox, QTextEdit, QProgressBar, QMessageBox, QTabWidget,
+    QGroupBox, QPlainTextEdit, QProgressBar, QMessageBox, QTabWidget,
     QSpacerItem, QSizePolicy, QFrame, QDialog, QDoubleSpinBox
 )
-from PySide6.QtCore import Qt, QThread, QTimer, Signal, QObject, QMutex
+from PySide6.QtCore import (
+    Qt, QThread, QTimer, Signal, QObject, QMutex
+)
 from PySide6.QtGui import QFont, QIcon, QPalette, QColor, QPixmap
 
-from .config import ConfigManager, DeviceDetector, ModelDetector, REFORMATTER_AVAILABLE, ReformattingMode
+from .config import ConfigManager, DeviceDetector, ModelDetector, REFORMATTER_AVAILABLE, ReformattingMode, _get_hub_dir
 from .shortcut_recorder import ShortcutRecorderDialog
 
 
+@functools.lru_cache(maxsize=1)
+def _get_whisper_model():
+    """
+    Import faster-whisper's WhisperModel on first use.
+    
+    Reason: the import pulls in ctranslate2 and numpy, so only the first
+    download pays for it and later download dialogs start immediately.
+    """
+    from faster_whisper import WhisperModel
+    return WhisperModel
+
+
+@functools.lru_cache(maxsize=1)
+def _hf_transfer_available() -> bool:
+    """
+    Check whether the opt-in hf_transfer downloader is installed.
+    
+    Reason: huggingface_hub fails every download when HF_HUB_ENABLE_HF_TRANSFER
+    is set without the package, so the flag is only set when this is True.
+    Progress and cancellation do not depend on it: ModelDownloadThread polls
+    the cache's .incomplete files and abandons steps from its own loop.
+    """
+    return importlib.util.find_spec("hf_transfer") is not None
+
+
+# Files faster-whisper loads from a CTranslate2 repo (as in its download_model)
+_CT2_FILE_PATTERNS = (
+    "config.json", "preprocessor_config.json", "model.bin", "tokenizer.json", "vocabulary.*"
+)
+
+# Seconds between cancel checks while a download step runs
+_CANCEL_POLL_INTERVAL = 0.1
+
+# Files the transformers loader and the CTranslate2 converter read from a
+# transformers-format repo; other weight formats (flax, tf, onnx) are skipped
+_TRANSFORMERS_FILE_PATTERNS = (
+    "*.json", "*.safetensors", "tokenizer*", "vocab*", "merges.txt", "*.txt"
+)
+
+
+def _select_transformers_files(repo_files: List[str]) -> List[str]:
+    """
+    Pick the files needed to load (and convert) a transformers-format model.
+    
+    Only top-level files are considered. PyTorch .bin weights are included
+    only when the repo has no safetensors weights.
+    
+    Args:
+        repo_files (List[str]): All file paths in the repo.
+    
+    Returns:
+        List[str]: The file paths to download.
+    """
+    top_level = [name for name in repo_files if "/" not in name]
+    selected = [
+        name for name in top_level
+        if any(fnmatch.fnmatch(name, pattern) for pattern in _TRANSFORMERS_FILE_PATTERNS)
+    ]
+    if not any(name.endswith(".safetensors") for name in selected):
+        selected += [name for name in top_level if fnmatch.fnmatch(name, "pytorch_model*.bin")]
+    return selected
+
+
+def _blob_etag(sibling) -> Optional[str]:
+    """
+    Get the etag the HuggingFace cache names a repo file's blob after.
+    
+    Args:
+        sibling: A RepoSibling from model_info(files_metadata=True).
+    
+    Returns:
+        Optional[str]: The LFS SHA-256 for LFS files, otherwise the git blob
+        ID; None if the metadata has neither.
+    """
+    lfs = getattr(sibling, "lfs", None)
+    if lfs is not None:
+        return lfs["sha256"] if isinstance(lfs, dict) else lfs.sha256
+    return getattr(sibling, "blob_id", None)
+
+
+def _file_size(path: Path) -> int:
+    """
+    Get the size of a file that may not exist (yet).
+    
+    Args:
+        path (Path): The file to measure.
+    
+    Returns:
+        int: Its size in bytes, or 0 if it is missing.
+    """
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
+class _DownloadCancelled(Exception):
+    """Raised on the download thread when the user has cancelled."""
+
+
+# Download step threads by repo ID; a cancelled step keeps running until its file is done
+_running_steps: Dict[str, threading.Thread] = {}
+_running_steps_lock = threading.Lock()
+
+
 class ModelDownloadThread(QThread):
     """
     Thread for downloading Whisper models.
@@ -45,85 +156,188 @@ class ModelDownloadThread(QThread):
     def __init__(self, model_name: str):
         super().__init__()
         self.model_name = model_name
+        self._cancel = threading.Event()
         self.logger = logging.getLogger(f"{__name__}.ModelDownload")
     
+    def cancel(self) -> None:
+        """Ask the download to stop; run() returns within a poll interval."""
+        self._cancel.set()
+    
+    def _check_cancelled(self) -> None:
+        """Raise _DownloadCancelled if cancel() has been called."""
+        if self._cancel.is_set():
+            raise _DownloadCancelled()
+    
+    def _run_cancellable(self, func, *args, poll=None, track=None, **kwargs):
+        """
+        Run a blocking download step while watching for cancellation.
+        
+        Reason: hub downloads cannot be interrupted from outside, so the step
+        runs on a daemon helper thread and this thread stops waiting for it
+        on cancel. The helper itself keeps downloading its file to the end;
+        steps registered with track make a later download of the same repo
+        wait for it (see _wait_for_running_step) instead of competing for
+        the blob's lock and .incomplete file.
+        
+        Args:
+            func: The blocking step, called as func(*args, **kwargs).
+            poll: Optional callable run on this thread every poll interval
+                while the step is running.
+            track (Optional[str]): Repo ID to register the step under while
+                it runs.
+        
+        Returns:
+            The result of func(*args, **kwargs).
+        
+        Raises:
+            _DownloadCancelled: If cancel() is called before the step ends.
+        """
+        result = {}
+        
+        def target():
+            try:
+                result["value"] = func(*args, **kwargs)
+            except Exception as e:
+                result["error"] = e
+            finally:
+                if track is not None:
+                    with _running_steps_lock:
+                        if _running_steps.get(track) is threading.current_thread():
+                            del _running_steps[track]
+        
+        worker = threading.Thread(target=target, name="ModelDownloadStep", daemon=True)
+        if track is not None:
+            with _running_steps_lock:
+                _running_steps[track] = worker
+        worker.start()
+        while worker.is_alive():
+            worker.join(_CANCEL_POLL_INTERVAL)
+            self._check_cancelled()
+            if poll is not None and worker.is_alive():
+                poll()
+        
+        if "error" in result:
+            raise result["error"]
+        return result.get("value")
+    
+    def _wait_for_running_step(self, repo_id: str) -> None:
+        """
+        Wait for a cancelled earlier download of the same repo to finish.
+        
+        Args:
+            repo_id (str): HuggingFace repo ID about to be downloaded.
+        
+        Raises:
+            _DownloadCancelled: If cancel() is called while waiting.
+        """
+        with _running_steps_lock:
+            previous = _running_steps.get(repo_id)
+        if previous is None or not previous.is_alive():
+            return
+        
+        self.status_updated.emit(f"Waiting for the previous download of {repo_id} to finish...")
+        while previous.is_alive():
+            previous.join(_CANCEL_POLL_INTERVAL)
+            self._check_cancelled()
+    
     def run(self):
         """Download the specified model."""
         try:
             self.status_updated.emit(f"Initializing download for {self.model_name}...")
             self.progress_updated.emit(0)
             
-            # Import WhisperModel here to avoid import issues
-            from faster_whisper import WhisperModel
+            # Use the parallel Rust downloader when installed; huggingface_hub
+            # reads this flag when first imported, so set it before the import
+            if _hf_transfer_available():
+                os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+            
+            from huggingface_hub import HfApi
             
             self.status_updated.emit("Connecting to model repository...")
-            self.progress_updated.emit(10)
+            repo_id = ModelDetector.resolve_repo_id(self.model_name)
+            self._wait_for_running_step(repo_id)
+            info = self._run_cancellable(HfApi().model_info, repo_id, files_metadata=True)
+            sizes = {sibling.rfilename: sibling.size or 0 for sibling in info.siblings}
+            etags = {sibling.rfilename: _blob_etag(sibling) for sibling in info.siblings}
+            repo_files = list(sizes)
             
-            # Check if this is a standard faster-whisper model or HuggingFace model
-            if "/" in self.model_name:
-                # HuggingFace model - check if it's compatible
-                self.status_updated.emit("Checking model compatibility...")
-                self.progress_updated.emit(20)
-                
-                # Some HuggingFace models need to be downloaded with transformers first
-                # then converted for faster-whisper usage
-                try:
-                    # Try direct faster-whisper loading first
-                    self.status_updated.emit(f"Downloading {self.model_name} via faster-whisper...")
-                    self.progress_updated.emit(40)
-                    
-                    model = WhisperModel(self.model_name, local_files_only=False)
-                    
-                    self.status_updated.emit("Verifying model integrity...")
-                    self.progress_updated.emit(90)
-                    
-                    # Clean up model object
-                    del model
-                    
-                except Exception as e:
-                    # If faster-whisper can't handle it, try using transformers to download
-                    self.logger.warning(f"faster-whisper failed, trying transformers approach: {e}")
-                    self.status_updated.emit("Model requires transformers download...")
-                    self.progress_updated.emit(50)
-                    
-                    # Download with transformers (this will cache it)
-                    from transformers import AutoProcessor, AutoModelForSpeechSeq2Seq
-                    
-                    self.status_updated.emit("This might take a while... Model files are quite large (GB). Please check back in 30 minutes.")
-                    self.progress_updated.emit(65)
-                    
-                    processor = AutoProcessor.from_pretrained(self.model_name)
-                    
-                    self.status_updated.emit("Downloading main model files... This is the largest part and may take 20-30 minutes.")
-                    self.progress_updated.emit(70)
-                    
-                    model = AutoModelForSpeechSeq2Seq.from_pretrained(self.model_name)
-                    
-                    # Clean up
-                    del processor, model
-                    
-                    self.status_updated.emit("Large model download complete! Model cached successfully.")
-                    self.progress_updated.emit(95)
+            # Check if this is a faster-whisper (CTranslate2) model or one
+            # that needs converting from transformers format when first used
+            is_ct2 = "model.bin" in repo_files
+            if is_ct2:
+                files = [
+                    name for name in repo_files
+                    if any(fnmatch.fnmatch(name, pattern) for pattern in _CT2_FILE_PATTERNS)
+                ]
             else:
-                # Standard faster-whisper model
-                self.status_updated.emit(f"Downloading {self.model_name}...")
-                self.progress_updated.emit(30)
-                
-                model = WhisperModel(self.model_name, local_files_only=False)
-                
+                self.status_updated.emit("Model requires a full repository download...")
+                files = _select_transformers_files(repo_files)
+            if not files:
+                raise ValueError(f"No Whisper model files found in {repo_id}")
+            
+            self._download_files(repo_id, files, sizes, etags)
+            
+            if is_ct2:
                 self.status_updated.emit("Verifying model integrity...")
-                self.progress_updated.emit(90)
-                
-                # Clean up model object
-                del model
+                WhisperModel = self._run_cancellable(_get_whisper_model)
+                # Load from the cache only, to check the files; the model is discarded
+                self._run_cancellable(WhisperModel, self.model_name, download_root=str(_get_hub_dir()),
+                                      local_files_only=True)
+            else:
+                self.status_updated.emit("Large model download complete! Model cached successfully.")
             
             self.status_updated.emit("Download completed successfully!")
             self.progress_updated.emit(100)
             self.download_finished.emit()
             
+        except _DownloadCancelled:
+            self.logger.info(f"Download of {self.model_name} cancelled")
+            self.download_error.emit("Download cancelled")
         except Exception as e:
             self.logger.error(f"Error downloading model {self.model_name}: {e}")
             self.download_error.emit(str(e))
+    
+    def _download_files(self, repo_id: str, files: List[str], sizes: Dict[str, int],
+                        etags: Dict[str, Optional[str]]) -> None:
+        """
+        Download the given repo files into the HuggingFace cache one at a time.
+        
+        Progress is reported in bytes: completed files plus the size of the
+        current file's partial download in the cache. Cancellation is checked
+        while each file downloads, and completed files are never fetched again.
+        
+        Args:
+            repo_id (str): HuggingFace repo ID.
+            files (List[str]): File paths within the repo.
+            sizes (Dict[str, int]): File sizes in bytes, by path.
+            etags (Dict[str, Optional[str]]): Blob etags, by path (see _blob_etag).
+        """
+        from huggingface_hub import hf_hub_download
+        
+        # Reason: the same hub directory as model detection and the program,
+        # whatever huggingface_hub's own constants resolved at import time
+        cache_dir = _get_hub_dir()
+        blobs_dir = cache_dir / f"models--{repo_id.replace('/', '--')}" / "blobs"
+        total = sum(sizes.get(name, 0) for name in files) or 1
+        done = 0
+        
+        for index, filename in enumerate(files):
+            size = sizes.get(filename, 0)
+            etag = etags.get(filename)
+            partial_path = blobs_dir / f"{etag}.incomplete" if etag else None
+            
+            def poll(done=done, size=size, partial_path=partial_path):
+                # Reason: hub (and hf_transfer) write the file as <etag>.incomplete,
+                # whose size is the only progress visible from outside the download;
+                # only this file's blob is measured, not leftovers of older attempts
+                partial = min(_file_size(partial_path), size) if partial_path else 0
+                self.progress_updated.emit((done + partial) * 100 // total)
+            
+            self.status_updated.emit(f"Downloading {filename} ({index + 1}/{len(files)})...")
+            self._run_cancellable(hf_hub_download, repo_id, filename, cache_dir=str(cache_dir),
+                                  poll=poll, track=repo_id)
+            done += size
+            self.progress_updated.emit(done * 100 // total)
 
 
 class ModelDownloadDialog(QDialog):
@@ -135,6 +349,13 @@ class ModelDownloadDialog(QDialog):
         super().__init__(parent)
         self.model_name = model_name
         self.download_thread = None
+        self._cancelling = False
+        # Latest values from the download thread, applied by _update_timer
+        self._pending_progress: Optional[int] = None
+        self._pending_status: Optional[str] = None
+        self._update_timer = QTimer(self)
+        self._update_timer.setInterval(33)  # ~30 Hz
+        self._update_timer.timeout.connect(self._apply_pending_updates)
         self.setup_ui()
         self.start_download()
     
@@ -205,18 +426,41 @@ class ModelDownloadDialog(QDialog):
         self.download_thread.status_updated.connect(self.update_status)
         self.download_thread.download_finished.connect(self.download_completed)
         self.download_thread.download_error.connect(self.download_failed)
+        self.download_thread.finished.connect(self._download_thread_finished)
+        self._update_timer.start()
         self.download_thread.start()
     
     def update_progress(self, value: int):
-        """Update the progress bar."""
-        self.progress_bar.setValue(value)
+        """Record the latest progress; the bar is updated on the next tick."""
+        self._pending_progress = value
     
     def update_status(self, status: str):
-        """Update the status label."""
-        self.status_label.setText(status)
+        """Record the latest status; the label is updated on the next tick."""
+        self._pending_status = status
+    
+    def _apply_pending_updates(self):
+        """
+        Apply the most recent progress and status to the widgets.
+        
+        Reason: the download thread can report far faster than the screen
+        refreshes, so only the latest values are painted, at most ~30 times
+        a second.
+        """
+        if self._pending_progress is not None:
+            self.progress_bar.setValue(self._pending_progress)
+            self._pending_progress = None
+        if self._pending_status is not None:
+            self.status_label.setText(self._pending_status)
+            self._pending_status = None
+    
+    def _stop_updates(self):
+        """Stop the update timer after flushing any pending values."""
+        self._update_timer.stop()
+        self._apply_pending_updates()
     
     def download_completed(self):
         """Handle successful download completion."""
+        self._stop_updates()
         self.cancel_btn.setEnabled(False)
         self.close_btn.setEnabled(True)
         self.status_label.setText("Download completed successfully!")
@@ -228,6 +472,10 @@ class ModelDownloadDialog(QDialog):
     
     def download_failed(self, error: str):
         """Handle download failure."""
+        self._stop_updates()
+        if self._cancelling:
+            return
+        
         self.cancel_btn.setEnabled(False)
         self.close_btn.setEnabled(True)
         self.status_label.setText(f"Download failed: {error}")
@@ -237,20 +485,118 @@ class ModelDownloadDialog(QDialog):
     
     def cancel_download(self):
         """Cancel the download."""
+        self.reject()
+    
+    def reject(self):
+        """Close the dialog, letting a running download stop cleanly first."""
         if self.download_thread and self.download_thread.isRunning():
-            self.download_thread.terminate()
-            self.download_thread.wait(5000)  # Wait up to 5 seconds
+            # Reason: terminate() kills the thread mid-write and can leave a
+            # corrupt HF cache; the thread stops within a poll interval and
+            # _download_thread_finished then closes the dialog
+            self._cancelling = True
+            self.download_thread.cancel()
+            self._stop_updates()
+            self.cancel_btn.setEnabled(False)
+            self.status_label.setText("Cancelling download...")
+            return
         
-        self.reject()
+        super().reject()
+    
+    def _download_thread_finished(self):
+        """Close the dialog once a cancelled download has stopped."""
+        if self._cancelling:
+            super().reject()
     
     def closeEvent(self, event):
         """Handle dialog close event."""
         if self.download_thread and self.download_thread.isRunning():
-            self.download_thread.terminate()
-            self.download_thread.wait(5000)
+            self.reject()
+            event.ignore()
+            return
         event.accept()
 
 
+# Bytes requested per read of the program's stdout pipe
+_OUTPUT_READ_SIZE = 64 * 1024
+
+# Requested kernel buffer size for the program's stdout pipe (Linux only)
+_OUTPUT_PIPE_SIZE = 1024 * 1024
+
+# Interval (ms) at which queued program output is passed to the GUI
+_OUTPUT_FLUSH_INTERVAL = 33
+
+
+class OutputMonitor:
+    """
+    Reader that pulls the main program's stdout in bulk on a daemon thread.
+    
+    Complete lines are queued for ProgramController to pass on from the
+    GUI thread.
+    """
+    
+    def __init__(self, process: subprocess.Popen, output_queue: Deque[str]):
+        self.process = process
+        self.output_queue = output_queue
+        self.done = False
+        self._stop = threading.Event()
+    
+    def start(self) -> None:
+        """
+        Start reading on a daemon thread.
+        
+        Reason: the read blocks until the program closes its pipe, so the
+        thread must not be one the application waits for on exit (as it does
+        for QThreadPool.globalInstance()) or a program left running would
+        keep the GUI process alive.
+        """
+        thread = threading.Thread(target=self.run, name="OutputMonitor", daemon=True)
+        thread.start()
+    
+    def stop(self) -> None:
+        """Stop queueing output; the thread exits after its current read."""
+        self._stop.set()
+    
+    def run(self) -> None:
+        """Queue stdout lines until the program exits or closes its pipe."""
+        try:
+            self._read_output()
+        finally:
+            self.done = True
+    
+    def _read_output(self) -> None:
+        """Read the pipe in large chunks, queueing the complete lines of each."""
+        if not self.process.stdout:
+            return
+        
+        # Reason: Read the raw pipe in large chunks rather than waking for
+        # every line; deque appends are thread-safe
+        fd = self.process.stdout.fileno()
+        tail = b''
+        while True:
+            try:
+                data = os.read(fd, _OUTPUT_READ_SIZE)
+            except OSError:
+                break
+            if not data:
+                break
+            if self._stop.is_set():
+                return
+            
+            lines = (tail + data).split(b'\n')
+            tail = lines.pop()
+            if lines:
+                self.output_queue.append('\n'.join(
+                    line.decode('utf-8', errors='replace').strip() for line in lines
+                ))
+            
+            # A short read after exit means the pipe has been drained
+            if len(data) < _OUTPUT_READ_SIZE and self.process.poll() is not None:
+                break
+        
+        if tail:
+            self.output_queue.append(tail.decode('utf-8', errors='replace').strip())
+
+
 class ProgramController(QObject):
     """
     Controller for starting and stopping the main Dictationer program.
@@ -259,7 +605,8 @@ class ProgramController(QObject):
         program_started: Emitted when program starts successfully.
         program_stopped: Emitted when program stops.
         program_error: Emitted when program encounters an error.
-        output_received: Emitted when program output is received.
+        output_received: Emitted with the program output queued since the
+            last flush (one or more lines).
     """
     
     program_started = Signal()
@@ -270,6 +617,17 @@ class ProgramController(QObject):
     def __init__(self):
         super().__init__()
         self.process: Optional[subprocess.Popen] = None
+        self._output_monitor: Optional[OutputMonitor] = None
+        # Output queued by the monitor thread, flushed from the GUI thread
+        self._output_queue: Deque[str] = deque()
+        self._output_timer = QTimer(self)
+        self._output_timer.setInterval(_OUTPUT_FLUSH_INTERVAL)
+        self._output_timer.timeout.connect(self._flush_output)
+        # Environment the program's settings are layered over, built once
+        self._env_base: Optional[Dict[str, str]] = None
+        # Interpreter and script paths, located once per controller
+        self._python_exe: Optional[str] = None
+        self._main_script: Optional[str] = None
         self.logger = logging.getLogger(__name__)
     
     def start_program(self, config: Dict[str, Any]) -> bool:
@@ -290,32 +648,33 @@ class ProgramController(QObject):
             # Find the correct Python executable (venv or current)
             python_exe = self._find_python_executable()
             
-            # Prepare environment variables from config
-            env = os.environ.copy()  # Start with current environment
-            env["DICTATIONER_HOTKEY"] = config.get("hotkey", "ctrl+win+shift+l")
-            
             # Get the selected model name and ensure it's clean (no warning prefixes)
             model_name = config.get("whisper_model_size", "base")
             if model_name.startswith("[WARNING] "):
                 model_name = model_name.replace("[WARNING] ", "")
-            env["WHISPER_MODEL_SIZE"] = model_name
             
-            env["OUTPUT_DIRECTORY"] = config.get("output_directory", "outputs")
-            env["DEVICE_PREFERENCE"] = config.get("device_preference", "auto")
+            # Prepare environment variables from config over the shared base
+            env = {
+                **self._get_env_base(),
+                "DICTATIONER_HOTKEY": config.get("hotkey", "ctrl+win+shift+l"),
+                "WHISPER_MODEL_SIZE": model_name,
+                "OUTPUT_DIRECTORY": config.get("output_directory", "outputs"),
+                "DEVICE_PREFERENCE": config.get("device_preference", "auto")
+            }
             
             # Start the main program - use the main.py file directly
             main_script = self._find_main_script()
             
+            # Unbuffered binary pipe: OutputMonitor reads and decodes it in bulk
             self.process = subprocess.Popen(
                 [python_exe, main_script],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
                 env=env,
-                bufsize=1,
-                universal_newlines=True,
+                bufsize=0,
                 cwd=Path.cwd()  # Set working directory
             )
+            self._enlarge_output_pipe()
             
             # Start output monitoring thread
             self._start_output_monitor()
@@ -329,7 +688,56 @@ class ProgramController(QObject):
             self.program_error.emit(str(e))
             return False
     
+    def _get_env_base(self) -> Dict[str, str]:
+        """
+        Get the base environment for the program, built on first start.
+        
+        Returns:
+            Dict[str, str]: The GUI's environment plus the shared cache settings.
+        """
+        if self._env_base is None:
+            env = dict(os.environ)
+            # Pin the HuggingFace cache so the program loads the models the
+            # GUI lists and downloads instead of fetching its own copies
+            env.setdefault("HF_HUB_CACHE", str(_get_hub_dir()))
+            if _hf_transfer_available():
+                env.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+            self._env_base = env
+        return self._env_base
+    
+    def _enlarge_output_pipe(self) -> None:
+        """
+        Grow the program's stdout pipe so a verbose child rarely blocks on it.
+        
+        Only supported on Linux; elsewhere the default pipe size is kept.
+        """
+        if not sys.platform.startswith("linux"):
+            return
+        
+        try:
+            import fcntl
+            # F_SETPIPE_SZ is only exposed by fcntl from Python 3.10
+            fcntl.fcntl(
+                self.process.stdout.fileno(),
+                getattr(fcntl, "F_SETPIPE_SZ", 1031),
+                _OUTPUT_PIPE_SIZE
+            )
+        except OSError as e:
+            # Reason: Unprivileged users are capped by /proc/sys/fs/pipe-max-size
+            self.logger.debug(f"Could not enlarge output pipe: {e}")
+    
     def _find_python_executable(self) -> str:
+        """
+        Get the Python executable to use, searching only on first call.
+        
+        Returns:
+            str: Path to Python executable.
+        """
+        if self._python_exe is None:
+            self._python_exe = self._search_python_executable()
+        return self._python_exe
+    
+    def _search_python_executable(self) -> str:
         """
         Find the correct Python executable to use.
         
@@ -385,6 +793,17 @@ class ProgramController(QObject):
         return sys.executable
     
     def _find_main_script(self) -> str:
+        """
+        Get the main.py script to execute, searching only on first call.
+        
+        Returns:
+            str: Path to main.py script.
+        """
+        if self._main_script is None:
+            self._main_script = self._search_main_script()
+        return self._main_script
+    
+    def _search_main_script(self) -> str:
         """
         Find the main.py script to execute.
         
@@ -432,6 +851,8 @@ class ProgramController(QObject):
                 self.process.wait(timeout=2)
             
             self.process = None
+            # Show the program's last output before the stopped message
+            self._flush_output()
             self.program_stopped.emit()
             self.logger.info("Main program stopped successfully")
             return True
@@ -454,17 +875,33 @@ class ProgramController(QObject):
         return self.process.poll() is None
     
     def _start_output_monitor(self) -> None:
-        """Start monitoring program output in a separate thread."""
-        def monitor_output():
-            if self.process and self.process.stdout:
-                for line in iter(self.process.stdout.readline, ''):
-                    if line:
-                        self.output_received.emit(line.strip())
-                    if self.process.poll() is not None:
-                        break
-        
-        thread = threading.Thread(target=monitor_output, daemon=True)
-        thread.start()
+        """Start monitoring program output on a daemon thread."""
+        if not self.process:
+            return
+        
+        self._output_monitor = OutputMonitor(self.process, self._output_queue)
+        self._output_monitor.start()
+        self._output_timer.start()
+    
+    def stop_output_monitor(self) -> None:
+        """Stop relaying program output, e.g. when the GUI exits without stopping it."""
+        self._output_timer.stop()
+        if self._output_monitor is not None:
+            self._output_monitor.stop()
+    
+    def _flush_output(self) -> None:
+        """Emit all queued program output as one output_received signal."""
+        # Read the flag first so output queued just before it was set is drained
+        monitor_done = self._output_monitor is None or self._output_monitor.done
+        
+        chunks = []
+        while self._output_queue:
+            chunks.append(self._output_queue.popleft())
+        if chunks:
+            self.output_received.emit('\n'.join(chunks))
+        
+        if monitor_done:
+            self._output_timer.stop()
 
 
 class SettingsWidget(QWidget):
@@ -480,6 +917,10 @@ class SettingsWidget(QWidget):
         self.config_manager = config_manager
         self.controller = program_controller
         self.main_gui = main_gui
+        # Cached model list the dropdown was last built from
+        self._cached_models_sig: Tuple[str, ...] = ()
+        # (gpu_info, cuda_test_passed) from the last GPU check
+        self._gpu_info_cache: Optional[tuple] = None
         self.setup_ui()
         self.load_settings()
         if self.controller:
@@ -513,6 +954,7 @@ class SettingsWidget(QWidget):
         
         # GPU Info Button
         self.gpu_info_btn = QPushButton("Check GPU Info")
+        self.gpu_info_btn.setToolTip("Shift+click to check the GPU again")
         self.gpu_info_btn.clicked.connect(self.show_gpu_info)
         device_layout.addWidget(self.gpu_info_btn, 0, 2)
         
@@ -880,15 +1322,34 @@ class SettingsWidget(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            self.config_manager.config = self.config_manager.DEFAULT_CONFIG.copy()
+            self.config_manager.config = dict(self.config_manager.DEFAULT_CONFIG)
             self.load_settings()
             QMessageBox.information(self, "Settings", "Settings reset to defaults!")
     
+    def _get_gpu_info(self, refresh: bool = False) -> tuple:
+        """
+        Get GPU information, checking the GPU only on first use or on refresh.
+        
+        Args:
+            refresh (bool): Re-read memory usage and re-run the CUDA test.
+        
+        Returns:
+            tuple: (gpu_info dict, CUDA test passed)
+        """
+        if self._gpu_info_cache is None or refresh:
+            gpu_info = DeviceDetector.get_gpu_info()
+            cuda_ok = gpu_info["available"] and DeviceDetector.probe_gpu()
+            self._gpu_info_cache = (gpu_info, cuda_ok)
+        return self._gpu_info_cache
+    
     def show_gpu_info(self) -> None:
-        """Display detailed GPU information."""
-        gpu_info = DeviceDetector.get_gpu_info()
+        """Display detailed GPU information (Shift+click to re-check)."""
+        refresh = bool(QApplication.keyboardModifiers() & Qt.ShiftModifier)
+        gpu_info, cuda_ok = self._get_gpu_info(refresh)
         
         info_text = f"GPU Available: {gpu_info['available']}\n"
+        if gpu_info["available"]:
+            info_text += f"CUDA Test: {'Passed' if cuda_ok else 'Failed'}\n"
         info_text += f"Device Count: {gpu_info['device_count']}\n\n"
         
         for device in gpu_info["devices"]:
@@ -904,15 +1365,39 @@ class SettingsWidget(QWidget):
         QMessageBox.information(self, "GPU Information", info_text)
     
     def refresh_models(self) -> None:
-        """Refresh the list of cached models with validation."""
-        self.cached_model_combo.clear()
-        
-        # Get cached models
+        """Refresh the list of cached models, rebuilding it only when it changed."""
         cached_models = ModelDetector.get_cached_models()
+        signature = tuple(cached_models)
+        if signature == self._cached_models_sig and self.cached_model_combo.count():
+            return
+        self._cached_models_sig = signature
+        
+        # Reason: clear() and addItem() each fire currentTextChanged, which
+        # would queue auto-saves of intermediate selections
+        previous = self.cached_model_combo.currentText()
+        self.cached_model_combo.blockSignals(True)
+        try:
+            self._populate_model_combo(cached_models)
+            index = self.cached_model_combo.findText(previous)
+            if index >= 0:
+                self.cached_model_combo.setCurrentIndex(index)
+        finally:
+            self.cached_model_combo.blockSignals(False)
+        
+        if self.cached_model_combo.currentText() != previous:
+            self.auto_save_settings()
+    
+    def _populate_model_combo(self, cached_models: List[str]) -> None:
+        """
+        Fill the model dropdown with the cached standard and valid HuggingFace models.
+        
+        Args:
+            cached_models (List[str]): Models found in the HuggingFace cache.
+        """
+        self.cached_model_combo.clear()
         
         # Add only standard models that are actually cached
-        standard_models = ["base", "small", "medium", "large", "tiny", "large-v1", "large-v2", "large-v3"]
-        for model in standard_models:
+        for model in ModelDetector.STANDARD_MODELS:
             if model in cached_models:
                 self.cached_model_combo.addItem(model)
                 self.cached_model_combo.setItemData(
@@ -948,10 +1433,7 @@ class SettingsWidget(QWidget):
             print(f"[DEBUG] No cached models found!")
             print(f"[DEBUG] Cached models detected: {cached_models}")
             
-            import os
-            from pathlib import Path
-            cache_dir = os.environ.get("HF_HOME", Path.home() / ".cache" / "huggingface")
-            model_path = Path(cache_dir) / "hub"
+            model_path = _get_hub_dir()
             print(f"[DEBUG] Looking in cache directory: {model_path}")
             print(f"[DEBUG] Cache directory exists: {model_path.exists()}")
             if model_path.exists():
@@ -1005,8 +1487,7 @@ class SettingsWidget(QWidget):
         
         try:
             # Get the HuggingFace cache directory
-            cache_dir = os.environ.get("HF_HOME", Path.home() / ".cache" / "huggingface")
-            models_dir = Path(cache_dir) / "hub"
+            models_dir = _get_hub_dir()
             
             # Create the directory if it doesn't exist
             models_dir.mkdir(parents=True, exist_ok=True)
@@ -1207,7 +1688,7 @@ class ProgramControlWidget(QWidget):
         output_group = QGroupBox("Program Output")
         output_layout = QVBoxLayout(output_group)
         
-        self.output_display = QTextEdit()
+        self.output_display = QPlainTextEdit()
         self.output_display.setReadOnly(True)
         self.output_display.document().setMaximumBlockCount(1000)  # Limit lines
         output_layout.addWidget(self.output_display)
@@ -1253,7 +1734,7 @@ class ProgramControlWidget(QWidget):
         self.status_label.setStyleSheet("font-weight: bold; color: #4CAF50;")
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
-        self.output_display.append("Recording system started successfully!")
+        self.output_display.appendPlainText("Recording system started successfully!")
     
     def on_program_stopped(self) -> None:
         """Handle program stopped signal."""
@@ -1261,17 +1742,17 @@ class ProgramControlWidget(QWidget):
         self.status_label.setStyleSheet("font-weight: bold; color: #f44336;")
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
-        self.output_display.append("Recording system stopped.")
+        self.output_display.appendPlainText("Recording system stopped.")
     
     def on_program_error(self, error: str) -> None:
         """Handle program error signal."""
         self.status_label.setText("ERROR")
         self.status_label.setStyleSheet("font-weight: bold; color: #FF9800;")
-        self.output_display.append(f"Error: {error}")
+        self.output_display.appendPlainText(f"Error: {error}")
     
     def on_output_received(self, output: str) -> None:
         """Handle program output signal."""
-        self.output_display.append(output)
+        self.output_display.appendPlainText(output)
         
         # Auto-scroll to bottom
         cursor = self.output_display.textCursor()
@@ -1456,7 +1937,7 @@ class DictationerGUI(QMainWindow):
                 color: #777777;
                 border-color: #444444;
             }
-            QTextEdit {
+            QTextEdit, QPlainTextEdit {
                 background-color: #1e1e1e;
                 color: #ffffff;
                 font-family: 'Courier New', monospace;
@@ -1599,6 +2080,9 @@ class DictationerGUI(QMainWindow):
             
             if reply == QMessageBox.StandardButton.Yes:
                 self.control_widget.stop_program()
+            else:
+                # Leave the program running but stop reading its output
+                self.control_widget.controller.stop_output_monitor()
         
         # Stop reformatter service if running
         if self.reformatter_controller:
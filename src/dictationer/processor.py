@@ -14,17 +14,16 @@ import subprocess
 import sys
 from pathlib import Path
 from typing import Optional, Callable
-from watchdog.observers import Observer
+import numpy as np
 from watchdog.events import FileSystemEventHandler, FileCreatedEvent
 from faster_whisper import WhisperModel
 
-# Import ClipboardPaster for automatic pasting
+# Import batched inference pipeline (faster-whisper >= 1.1)
 try:
-    from .paster import ClipboardPaster
-    PASTER_AVAILABLE = True
-except ImportError as e:
-    PASTER_AVAILABLE = False
-    _paster_import_error = str(e)
+    from faster_whisper import BatchedInferencePipeline
+    BATCHED_INFERENCE_AVAILABLE = True
+except ImportError:
+    BATCHED_INFERENCE_AVAILABLE = False
 
 # Import status indicator
 try:
@@ -41,6 +40,9 @@ except ImportError as e:
     CONFIG_AVAILABLE = False
     _config_import_error = str(e)
 
+# Silero VAD settings for faster-whisper: pauses shorter than this stay in the audio
+_VAD_PARAMETERS = {"min_silence_duration_ms": 500}
+
 
 class AudioFileHandler(FileSystemEventHandler):
     """
@@ -154,7 +156,7 @@ class AudioProcessor:
     are created in the specified directory.
     """
     
-    def __init__(self, model_size: str = "base", watch_directory: str = "outputs", auto_paste: bool = True, enable_file_monitoring: bool = True):
+    def __init__(self, model_size: str = "base", watch_directory: str = "outputs", auto_paste: bool = True, enable_file_monitoring: bool = True, batch_size: int = 8, compute_type: Optional[str] = None, device: str = "auto", beam_size: int = 5, vad_filter: bool = True):
         """
         Initialize the audio processor.
         
@@ -163,6 +165,16 @@ class AudioProcessor:
             watch_directory: Directory to monitor for new audio files.
             auto_paste: Whether to automatically paste transcribed text to clipboard.
             enable_file_monitoring: Whether to enable file system monitoring (default: True).
+            batch_size: Number of 30 s segments decoded together by the batched pipeline (default: 8).
+            compute_type: CTranslate2 compute type to load the model with (e.g. "int8", "float16").
+                None picks "int8_float16" on CUDA (falling back to "float16") and "int8" on CPU.
+            device: "cuda", "cpu", or "auto" to follow the configured device preference
+                and GPU detection (default: "auto").
+            beam_size: Beam width for decoding (default: 5). 1 is greedy decoding, which is
+                several times faster per sentence at a small cost in accuracy.
+            vad_filter: Whether faster-whisper skips non-speech with its Silero VAD
+                before decoding (default: True). Batched inference needs VAD, so
+                False always uses sequential decoding.
         """
         # Store original model name for cache checking and type detection
         self.original_model_size = model_size
@@ -171,6 +183,11 @@ class AudioProcessor:
         self.watch_directory = Path(watch_directory)
         self.auto_paste = auto_paste
         self.enable_file_monitoring = enable_file_monitoring
+        self.batch_size = batch_size
+        self.compute_type = compute_type
+        self.beam_size = beam_size
+        self.vad_filter = vad_filter
+        self._pcm_buffer = np.empty(0, dtype=np.float32)  # Reused by transcribe_pcm
         
         if not hasattr(self, 'logger'):
             self.logger = self._setup_logging()
@@ -180,6 +197,7 @@ class AudioProcessor:
         self.logger.info(f"[PROCESSOR] Watch directory: {watch_directory}")
         self.logger.info(f"[PROCESSOR] Auto-paste enabled: {auto_paste}")
         self.logger.info(f"[PROCESSOR] File monitoring enabled: {enable_file_monitoring}")
+        self.logger.info(f"[PROCESSOR] Compute type: {compute_type or 'auto'}")
         
         # Initialize device configuration
         self.device_config = None
@@ -204,6 +222,13 @@ class AudioProcessor:
             self.logger.warning(f"[PROCESSOR] Device configuration not available: {_config_import_error}")
             self.device_config = {"use_gpu": False, "device": "cpu", "preference": "cpu"}
         
+        # An explicit device overrides the configured preference; a CUDA load
+        # that fails still falls back to CPU in _load_whisper_model
+        if device != "auto":
+            use_gpu = device == "cuda"
+            self.device_config = {**self.device_config, "use_gpu": use_gpu, "device": "cuda" if use_gpu else "cpu"}
+            self.logger.info(f"[PROCESSOR] Device overridden by caller: {self.device_config['device']}")
+        
         # Check if model is cached (for HF models) - use original model name
         if "/" in self.original_model_size:
             try:
@@ -234,8 +259,23 @@ class AudioProcessor:
             else:
                 raise Exception(f"Failed to load Whisper model '{self.original_model_size}': {str(e)}")
         
+        # Wrap the model once so audio longer than 30 s is split and decoded as a batch
+        self.batched_model = None
+        if BATCHED_INFERENCE_AVAILABLE and not self.vad_filter:
+            # Reason: the pipeline relies on VAD for its segment boundaries
+            # (see _run_whisper); leaving it unset also keeps the recorder on
+            # single 30 s windows
+            self.logger.info("[PROCESSOR] Batched inference disabled - requires vad_filter=True")
+        elif BATCHED_INFERENCE_AVAILABLE:
+            self.batched_model = BatchedInferencePipeline(model=self.model)
+            self.logger.info(f"[PROCESSOR] Batched inference enabled (batch_size={self.batch_size})")
+        else:
+            self.logger.info("[PROCESSOR] Batched inference not available - requires faster-whisper >= 1.1")
+        
         # Set up file monitoring (only if enabled)
         if self.enable_file_monitoring:
+            # Imported here so direct-transcription mode never loads the observer backends
+            from watchdog.observers import Observer
             self.observer = Observer()
             self.file_handler = AudioFileHandler(self)
             self._monitoring = False
@@ -247,17 +287,23 @@ class AudioProcessor:
         
         # Initialize ClipboardPaster if auto-paste is enabled and available
         self.paster = None
-        if self.auto_paste and PASTER_AVAILABLE:
+        if self.auto_paste:
+            # Imported here so the clipboard/keyboard backends only load when pasting is on
             try:
-                self.paster = ClipboardPaster()
-                self.logger.info("[PROCESSOR] ClipboardPaster initialized successfully")
-            except Exception as e:
-                self.logger.error(f"[PROCESSOR] Failed to initialize ClipboardPaster: {e}")
-                self.paster = None
-                print(f"Warning: Auto-paste disabled due to initialization error: {e}")
-        elif self.auto_paste and not PASTER_AVAILABLE:
-            self.logger.warning(f"[PROCESSOR] ClipboardPaster not available: {_paster_import_error}")
-            print(f"Warning: Auto-paste disabled - ClipboardPaster not available: {_paster_import_error}")
+                from .paster import ClipboardPaster
+            except ImportError as e:
+                ClipboardPaster = None
+                self.logger.warning(f"[PROCESSOR] ClipboardPaster not available: {e}")
+                print(f"Warning: Auto-paste disabled - ClipboardPaster not available: {e}")
+            
+            if ClipboardPaster is not None:
+                try:
+                    self.paster = ClipboardPaster()
+                    self.logger.info("[PROCESSOR] ClipboardPaster initialized successfully")
+                except Exception as e:
+                    self.logger.error(f"[PROCESSOR] Failed to initialize ClipboardPaster: {e}")
+                    self.paster = None
+                    print(f"Warning: Auto-paste disabled due to initialization error: {e}")
         
         # Ensure watch directory exists
         self.watch_directory.mkdir(exist_ok=True)
@@ -446,13 +492,13 @@ class AudioProcessor:
                 
                 # GPU-aware loading strategies for HuggingFace models
                 if use_gpu and device == "cuda":
-                    self.logger.info("[PROCESSOR] Attempting GPU loading with float16 precision")
+                    self.logger.info("[PROCESSOR] Attempting GPU loading with int8_float16 precision")
                     loading_strategies = [
-                        # GPU strategies with float16 for better performance
-                        {"device": "cuda", "compute_type": "float16", "local_files_only": False},
-                        {"device": "cuda", "compute_type": "float16", "local_files_only": True},
+                        # GPU strategies: int8 weights with float16 compute first (faster, less VRAM)
                         {"device": "cuda", "compute_type": "int8_float16", "local_files_only": False},
                         {"device": "cuda", "compute_type": "int8_float16", "local_files_only": True},
+                        {"device": "cuda", "compute_type": "float16", "local_files_only": False},
+                        {"device": "cuda", "compute_type": "float16", "local_files_only": True},
                         # Fallback to CPU if GPU fails
                         {"device": "cpu", "compute_type": "int8", "local_files_only": False},
                         {"device": "cpu", "compute_type": "float32", "local_files_only": False},
@@ -468,6 +514,11 @@ class AudioProcessor:
                         {"device": "cpu", "compute_type": "float32", "local_files_only": True},
                     ]
                 
+                # Try the requested compute type first, keeping the defaults as fallbacks
+                if self.compute_type:
+                    primary_device = loading_strategies[0]["device"]
+                    loading_strategies.insert(0, {"device": primary_device, "compute_type": self.compute_type, "local_files_only": False})
+                
                 last_error = None
                 model_to_load = original_model_name
                 conversion_attempted = False
@@ -523,18 +574,26 @@ class AudioProcessor:
                 
                 if use_gpu and device == "cuda":
                     self.logger.info("[PROCESSOR] Loading standard model with GPU support")
-                    try:
-                        # Try GPU first with float16 for better performance
-                        self.model = WhisperModel(original_model_name, device="cuda", compute_type="float16")
-                        self.logger.info("[PROCESSOR] Standard model loaded successfully on GPU with float16")
-                    except Exception as e:
-                        self.logger.warning(f"[PROCESSOR] GPU loading failed, falling back to CPU: {e}")
+                    # Try GPU first with int8 weights and float16 compute; GPUs without
+                    # efficient int8 support reject it, so float16 is the next choice
+                    gpu_compute_types = [self.compute_type] if self.compute_type else ["int8_float16", "float16"]
+                    self.model = None
+                    for compute_type in gpu_compute_types:
+                        try:
+                            self.model = WhisperModel(original_model_name, device="cuda", compute_type=compute_type)
+                            self.logger.info(f"[PROCESSOR] Standard model loaded successfully on GPU with {compute_type}")
+                            break
+                        except Exception as e:
+                            self.logger.warning(f"[PROCESSOR] GPU loading with {compute_type} failed: {e}")
+                    
+                    if self.model is None:
+                        self.logger.warning("[PROCESSOR] GPU loading failed, falling back to CPU")
                         # Fallback to CPU
                         self.model = WhisperModel(original_model_name, device="cpu", compute_type="int8")
                         self.logger.info("[PROCESSOR] Standard model loaded successfully on CPU (GPU fallback)")
                 else:
                     self.logger.info("[PROCESSOR] Loading standard model on CPU")
-                    self.model = WhisperModel(original_model_name, device="cpu", compute_type="int8")
+                    self.model = WhisperModel(original_model_name, device="cpu", compute_type=self.compute_type or "int8")
                     self.logger.info("[PROCESSOR] Standard model loaded successfully on CPU")
                 
                 self._log_model_info()
@@ -610,76 +669,10 @@ class AudioProcessor:
                 self.logger.warning(f"[PROCESSOR] Empty file, skipping: {file_path}")
                 return None
             
-            # Perform transcription
-            self.logger.info(f"[PROCESSOR] Running Whisper transcription...")
-            
-            # COMMENTED OUT: Original simple transcription call (preserved for reference)
-            # segments, info = self.model.transcribe(file_path)
-            
-            # NEW: Enhanced transcription with Distil-Whisper parameters
-            # These parameters are specifically optimized for Distil-Whisper models
-            # but also work well with standard models
-            self.logger.info(f"[PROCESSOR] Using enhanced transcription parameters:")
-            self.logger.info(f"[PROCESSOR] - beam_size=5 (improved accuracy)")
-            self.logger.info(f"[PROCESSOR] - language='en' (English optimization)")
-            self.logger.info(f"[PROCESSOR] - condition_on_previous_text=False (better for distil models)")
-            
-            segments, info = self.model.transcribe(
-                file_path,
-                beam_size=5,
-                language="en",
-                condition_on_previous_text=False
-            )
-            
-            # Log detected language
-            self.logger.info(f"[PROCESSOR] Detected language: {info.language} (probability: {info.language_probability:.2f})")
-            
-            # Process and display results
-            print("\n" + "=" * 60)
-            print(f"TRANSCRIPTION RESULTS: {Path(file_path).name}")
-            print("=" * 60)
-            print(f"Language: {info.language} (confidence: {info.language_probability:.2f})")
-            print(f"Duration: {info.duration:.2f} seconds")
-            print("-" * 60)
-            
-            full_text = ""
-            segment_count = 0
-            
-            for segment in segments:
-                timestamp = f"[{segment.start:.2f}s -> {segment.end:.2f}s]"
-                text = segment.text.strip()
-                
-                print(f"{timestamp} {text}")
-                full_text += text + " "
-                segment_count += 1
-            
-            print("-" * 60)
-            print(f"Total segments: {segment_count}")
-            print("=" * 60)
-            print()
-            
-            self.logger.info(f"[PROCESSOR] Transcription completed successfully")
-            self.logger.info(f"[PROCESSOR] Segments processed: {segment_count}")
-            
-            # Get the final transcribed text
-            transcribed_text = full_text.strip()
+            transcribed_text = self._run_whisper(file_path, Path(file_path).name)
             
             # Automatically paste the transcribed text if enabled
-            if self.paster and transcribed_text:
-                self.logger.info("[PROCESSOR] Starting automatic paste workflow")
-                # Run pasting in a separate thread to avoid blocking
-                paste_thread = threading.Thread(
-                    target=self._paste_text_async,
-                    args=(transcribed_text,),
-                    daemon=True,
-                    name=f"Paste-{Path(file_path).name}"
-                )
-                paste_thread.start()
-                self.logger.info(f"[PROCESSOR] Paste thread started with ID: {paste_thread.ident}")
-            elif self.auto_paste and not self.paster:
-                self.logger.warning("[PROCESSOR] Auto-paste enabled but no paster available")
-            elif not transcribed_text:
-                self.logger.info("[PROCESSOR] No text to paste (empty transcription)")
+            self.paste_text(transcribed_text, Path(file_path).name)
             
             return transcribed_text
             
@@ -696,6 +689,161 @@ class AudioProcessor:
                 except Exception as e:
                     self.logger.error(f"[PROCESSOR] Failed to hide transcribing indicator: {e}")
     
+    def transcribe_pcm(self, pcm, label: str = "audio", initial_prompt: Optional[str] = None) -> Optional[str]:
+        """
+        Transcribe raw 16-bit mono 16kHz PCM audio held in memory.
+        
+        Unlike transcribe_file, this does not show the status indicator or
+        paste the result, so callers can transcribe a recording in pieces and
+        paste the combined text once. It reuses one conversion buffer, so calls
+        must not overlap (the recorder runs them on a single worker).
+        
+        Args:
+            pcm: 16-bit PCM samples at 16kHz, as bytes or a contiguous int16 array.
+            label: Name used for this audio in the printed results.
+            initial_prompt: Text spoken just before this audio, used as
+                decoding context when a recording is transcribed in pieces.
+            
+        Returns:
+            The transcribed text, or None if transcription failed.
+        """
+        samples = np.frombuffer(pcm, dtype=np.int16)
+        self.logger.info("[PROCESSOR] Starting in-memory transcription: %s (%s samples)", label, samples.size)
+        
+        try:
+            # faster-whisper accepts float32 samples in [-1, 1) at 16kHz directly
+            if self._pcm_buffer.size < samples.size:
+                self._pcm_buffer = np.empty(samples.size, dtype=np.float32)
+            audio = self._pcm_buffer[:samples.size]
+            # Reason: one vectorized multiply into a reused buffer converts and
+            # scales in a single pass, with no per-call float32 temporaries
+            np.multiply(samples, np.float32(1.0 / 32768.0), out=audio)
+            return self._run_whisper(audio, label, initial_prompt)
+        except Exception as e:
+            self.logger.error("[PROCESSOR] Transcription failed for %s: %s", label, e)
+            print(f"\nERROR: Failed to transcribe {label}: {e}\n")
+            return None
+    
+    def warm_up(self):
+        """
+        Run a short silent transcription so the first real one starts warm.
+        
+        The first call into CTranslate2 pays one-time costs (moving weights to
+        the device, allocating buffers); this moves them off the user's path.
+        """
+        start_time = time.time()
+        segments, _ = self.model.transcribe(np.zeros(16000, dtype=np.float32), language="en")
+        # Reason: segments is a lazy generator - decoding only runs when consumed
+        for _ in segments:
+            pass
+        self.logger.info("[PROCESSOR] Model warm-up completed in %.2fs", time.time() - start_time)
+    
+    def _run_whisper(self, audio, label: str, initial_prompt: Optional[str] = None) -> str:
+        """
+        Run the Whisper model and print the segment-by-segment results.
+        
+        Args:
+            audio: Path to an audio file, or a float32 array of 16kHz samples.
+            label: Name used for this audio in the printed results.
+            initial_prompt: Optional text to condition the first window on.
+            
+        Returns:
+            The transcribed text (may be empty).
+        """
+        # Perform transcription
+        self.logger.info("[PROCESSOR] Running Whisper transcription...")
+        
+        # Reason: lazy %-style arguments are only formatted if a handler emits
+        # the record, so this costs nothing per call when INFO is filtered out
+        self.logger.info(
+            "[PROCESSOR] Transcription parameters: beam_size=%s, language='en', "
+            "condition_on_previous_text=False, vad_filter=%s, initial_prompt=%s",
+            self.beam_size, self.vad_filter, initial_prompt is not None
+        )
+        
+        # Reason: without VAD the batched pipeline needs explicit clip_timestamps
+        # and raises RuntimeError for audio of 30 s or more, so it is only used
+        # when VAD provides the segment boundaries
+        if self.batched_model is not None and self.vad_filter:
+            # Reason: the pipeline splits audio on speech boundaries into <=30 s
+            # segments and decodes them together, keeping the GPU busy.
+            segments, info = self.batched_model.transcribe(
+                audio,
+                beam_size=self.beam_size,
+                language="en",
+                condition_on_previous_text=False,
+                vad_filter=self.vad_filter,
+                vad_parameters=_VAD_PARAMETERS,
+                initial_prompt=initial_prompt,
+                batch_size=self.batch_size
+            )
+        else:
+            segments, info = self.model.transcribe(
+                audio,
+                beam_size=self.beam_size,
+                language="en",
+                condition_on_previous_text=False,
+                vad_filter=self.vad_filter,
+                vad_parameters=_VAD_PARAMETERS,
+                initial_prompt=initial_prompt
+            )
+        
+        # Log detected language
+        self.logger.info("[PROCESSOR] Detected language: %s (probability: %.2f)", info.language, info.language_probability)
+        
+        # Process and display results
+        print("\n" + "=" * 60)
+        print(f"TRANSCRIPTION RESULTS: {label}")
+        print("=" * 60)
+        print(f"Language: {info.language} (confidence: {info.language_probability:.2f})")
+        print(f"Duration: {info.duration:.2f} seconds")
+        print("-" * 60)
+        
+        full_text = ""
+        segment_count = 0
+        
+        for segment in segments:
+            timestamp = f"[{segment.start:.2f}s -> {segment.end:.2f}s]"
+            text = segment.text.strip()
+            
+            print(f"{timestamp} {text}")
+            full_text += text + " "
+            segment_count += 1
+        
+        print("-" * 60)
+        print(f"Total segments: {segment_count}")
+        print("=" * 60)
+        print()
+        
+        self.logger.info("[PROCESSOR] Transcription completed successfully (%s segments)", segment_count)
+        
+        # Get the final transcribed text
+        return full_text.strip()
+    
+    def paste_text(self, text: str, label: str = "audio"):
+        """
+        Paste transcribed text into the active application if auto-paste is enabled.
+        
+        Args:
+            text: The transcribed text.
+            label: Name of the transcribed audio, used for the paste thread name.
+        """
+        if self.paster and text:
+            self.logger.info("[PROCESSOR] Starting automatic paste workflow")
+            # Run pasting in a separate thread to avoid blocking
+            paste_thread = threading.Thread(
+                target=self._paste_text_async,
+                args=(text,),
+                daemon=True,
+                name=f"Paste-{label}"
+            )
+            paste_thread.start()
+            self.logger.info("[PROCESSOR] Paste thread started with ID: %s", paste_thread.ident)
+        elif self.auto_paste and not self.paster:
+            self.logger.warning("[PROCESSOR] Auto-paste enabled but no paster available")
+        elif not text:
+            self.logger.info("[PROCESSOR] No text to paste (empty transcription)")
+    
     def start_monitoring(self):
         """
         Start monitoring the watch directory for new audio files.
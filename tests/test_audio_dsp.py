@@ -0,0 +1,145 @@
+"""Tests for the streaming silence gates in dictationer.audio_dsp."""
+
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from dictationer import audio_dsp
+from dictationer.audio_dsp import EnergyGate, _FrameGate, _get_rms_mask, _rms_mask_numpy
+
+SAMPLE_RATE = 16000
+FRAME_MS = 30
+FRAME_LEN = SAMPLE_RATE * FRAME_MS // 1000  # 480 samples
+FRAME_BYTES = FRAME_LEN * 2
+
+
+def _frames(*levels):
+    """Build 16-bit PCM with one constant-amplitude frame per level."""
+    return np.concatenate([np.full(FRAME_LEN, level, dtype=np.int16) for level in levels]).tobytes()
+
+
+def _levels(data):
+    """Read back the amplitude of each frame in gated output."""
+    samples = np.frombuffer(bytes(data), dtype=np.int16)
+    return samples.reshape(-1, FRAME_LEN)[:, 0].tolist()
+
+
+@pytest.fixture
+def gate():
+    """Energy gate keeping two frames (60 ms) of padding on each side of sound."""
+    return EnergyGate(SAMPLE_RATE, frame_ms=FRAME_MS, threshold=200.0, padding_ms=60)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_rms_mask():
+    """Make every test pick its own RMS kernel."""
+    _get_rms_mask.cache_clear()
+    yield
+    _get_rms_mask.cache_clear()
+
+
+class TestEnergyGate:
+    """Pre-roll, hangover and buffering behaviour of the energy gate."""
+    
+    def test_keeps_pre_roll_and_hangover_around_sound(self, gate):
+        """Expected use: silence around sound is trimmed to the padding."""
+        data = _frames(1, 2, 3, 4, 1000, 1000, 5, 6, 7, 8)
+        
+        out = gate.process(data)
+        
+        # Two silent frames before the onset, two after the sound ends
+        assert _levels(out) == [3, 4, 1000, 1000, 5, 6]
+    
+    def test_all_silence_yields_nothing(self, gate):
+        """Edge case: pure silence is dropped entirely."""
+        assert len(gate.process(_frames(0, 0, 0, 0))) == 0
+    
+    def test_partial_frames_are_carried_over(self, gate):
+        """Edge case: a frame split across two calls is classified once whole."""
+        data = _frames(1000, 1000)
+        split = FRAME_BYTES + FRAME_BYTES // 2
+        
+        first = bytes(gate.process(data[:split]))
+        second = bytes(gate.process(data[split:]))
+        
+        assert first + second == data
+    
+    def test_sub_frame_input_returns_empty_view(self, gate):
+        """Edge case: less than one frame is buffered, not returned."""
+        out = gate.process(_frames(1000)[:FRAME_BYTES - 2])
+        
+        assert isinstance(out, memoryview)
+        assert len(out) == 0
+    
+    def test_hangover_carries_across_calls(self, gate):
+        """Edge case: the hangover continues into the next callback."""
+        gate.process(_frames(1000))
+        
+        assert _levels(gate.process(_frames(5, 6, 7))) == [5, 6]
+    
+    def test_reset_clears_pre_roll_and_hangover(self, gate):
+        """Expected use: reset() starts the next recording without old padding."""
+        gate.process(_frames(1000, 1, 2))
+        gate.process(_frames(9))
+        gate.reset()
+        
+        assert _levels(gate.process(_frames(1000))) == [1000]
+    
+    def test_output_buffer_is_reused(self, gate):
+        """Expected use: results are views into one buffer reused across calls."""
+        first = gate.process(_frames(1000))
+        kept = bytes(first)
+        gate.process(_frames(2000))
+        
+        assert first.obj is gate._out
+        assert bytes(first) != kept
+    
+    def test_requires_numpy(self, monkeypatch):
+        """Failure case: the energy gate cannot run without NumPy."""
+        monkeypatch.setattr(audio_dsp, "NUMPY_AVAILABLE", False)
+        
+        with pytest.raises(RuntimeError, match="numpy"):
+            EnergyGate(SAMPLE_RATE)
+    
+    def test_frame_gate_is_abstract(self):
+        """Failure case: the base class has no classifier of its own."""
+        with pytest.raises(TypeError):
+            _FrameGate(SAMPLE_RATE, FRAME_MS, 60)
+
+
+class TestRmsMask:
+    """NumPy and Numba RMS classifiers."""
+    
+    def test_numpy_fallback_without_numba(self, monkeypatch):
+        """Expected use: without Numba the NumPy classifier is used."""
+        monkeypatch.setitem(sys.modules, "numba", None)
+        
+        assert _get_rms_mask() is _rms_mask_numpy
+    
+    def test_numpy_ignores_trailing_partial_frame(self):
+        """Edge case: only complete frames are classified."""
+        samples = np.full(FRAME_LEN * 2 + 7, 1000, dtype=np.int16)
+        
+        assert _rms_mask_numpy(samples, FRAME_LEN, 200.0).tolist() == [True, True]
+    
+    def test_numpy_does_not_overflow_int16(self):
+        """Edge case: full-scale samples must not wrap when squared."""
+        samples = np.full(FRAME_LEN, -32768, dtype=np.int16)
+        
+        assert _rms_mask_numpy(samples, FRAME_LEN, 32000.0).tolist() == [True]
+    
+    def test_numba_matches_numpy(self):
+        """Expected use: the compiled kernel classifies exactly like NumPy."""
+        pytest.importorskip("numba")
+        rng = np.random.default_rng(0)
+        samples = rng.integers(-600, 600, FRAME_LEN * 20, dtype=np.int16)
+        readonly = np.frombuffer(samples.tobytes(), dtype=np.int16)
+        
+        rms_mask = _get_rms_mask()
+        
+        assert rms_mask is not _rms_mask_numpy
+        expected = _rms_mask_numpy(samples, FRAME_LEN, 300.0).tolist()
+        assert rms_mask(samples, FRAME_LEN, 300.0).tolist() == expected
+        assert rms_mask(readonly, FRAME_LEN, 300.0).tolist() == expected
@@ -0,0 +1,187 @@
+"""Tests for settings persistence in dictationer.config.ConfigManager."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from dictationer import config as config_module
+from dictationer.config import ConfigManager, ModelDetector, _get_hub_dir
+
+
+@pytest.fixture(autouse=True)
+def _no_env_overrides(monkeypatch):
+    """Keep environment overrides from leaking into the loaded settings."""
+    for env_key, _, _ in config_module._ENV_SPEC:
+        monkeypatch.delenv(env_key, raising=False)
+
+
+@pytest.fixture
+def settings_file(tmp_path):
+    """Path to a settings file that does not exist yet."""
+    return tmp_path / "config" / "settings.json"
+
+
+def _bump_mtime(path: Path) -> None:
+    """Move a file's mtime forward so the change is visible to the cache."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+
+
+class TestLoadConfig:
+    """mtime-cached reloads."""
+    
+    def test_loads_settings_from_file(self, settings_file):
+        """Expected use: values in the file override the defaults."""
+        settings_file.parent.mkdir()
+        settings_file.write_text(json.dumps({"whisper_model_size": "small"}))
+        
+        manager = ConfigManager(str(settings_file))
+        
+        assert manager.get("whisper_model_size") == "small"
+        assert manager.get("hotkey") == ConfigManager.DEFAULT_CONFIG["hotkey"]
+    
+    def test_unchanged_file_is_not_read_again(self, settings_file, monkeypatch):
+        """Edge case: a reload with the same mtime reuses the last parse."""
+        settings_file.parent.mkdir()
+        settings_file.write_text(json.dumps({"whisper_model_size": "small"}))
+        manager = ConfigManager(str(settings_file))
+        manager.set("whisper_model_size", "tiny")
+        
+        reads = []
+        real_read_bytes = Path.read_bytes
+        monkeypatch.setattr(Path, "read_bytes", lambda self: reads.append(self) or real_read_bytes(self))
+        manager.load_config()
+        
+        assert reads == []
+        assert manager.get("whisper_model_size") == "small"
+    
+    def test_changed_file_is_reloaded(self, settings_file):
+        """Edge case: an external edit with a new mtime is picked up."""
+        settings_file.parent.mkdir()
+        settings_file.write_text(json.dumps({"whisper_model_size": "small"}))
+        manager = ConfigManager(str(settings_file))
+        
+        settings_file.write_text(json.dumps({"whisper_model_size": "medium"}))
+        _bump_mtime(settings_file)
+        manager.load_config()
+        
+        assert manager.get("whisper_model_size") == "medium"
+    
+    def test_missing_file_keeps_defaults(self, settings_file):
+        """Edge case: without a settings file the defaults are used."""
+        manager = ConfigManager(str(settings_file))
+        
+        assert manager.config == dict(ConfigManager.DEFAULT_CONFIG)
+    
+    def test_corrupt_file_keeps_defaults(self, settings_file):
+        """Failure case: invalid JSON is logged and ignored."""
+        settings_file.parent.mkdir()
+        settings_file.write_text("{not json")
+        
+        manager = ConfigManager(str(settings_file))
+        
+        assert manager.config == dict(ConfigManager.DEFAULT_CONFIG)
+
+
+class TestSaveConfig:
+    """Atomic, skip-if-unchanged saves."""
+    
+    def test_save_round_trips(self, settings_file):
+        """Expected use: saved settings are loaded by a new manager."""
+        manager = ConfigManager(str(settings_file))
+        manager.set("hotkey", "ctrl+alt+d")
+        
+        assert manager.save_config() is True
+        assert ConfigManager(str(settings_file)).get("hotkey") == "ctrl+alt+d"
+        assert not settings_file.with_suffix(".json.tmp").exists()
+    
+    def test_unchanged_settings_are_not_rewritten(self, settings_file, monkeypatch):
+        """Edge case: saving the same settings again leaves the file alone."""
+        manager = ConfigManager(str(settings_file))
+        manager.save_config()
+        mtime_ns = settings_file.stat().st_mtime_ns
+        
+        replaced = []
+        monkeypatch.setattr(config_module.os, "replace", lambda *args: replaced.append(args))
+        
+        assert manager.save_config() is True
+        assert replaced == []
+        assert settings_file.stat().st_mtime_ns == mtime_ns
+    
+    def test_external_edit_is_overwritten(self, settings_file):
+        """Edge case: a file changed on disk is compared by content, not cache."""
+        manager = ConfigManager(str(settings_file))
+        manager.save_config()
+        settings_file.write_text(json.dumps({"hotkey": "f9"}))
+        _bump_mtime(settings_file)
+        
+        assert manager.save_config() is True
+        assert json.loads(settings_file.read_text())["hotkey"] == manager.get("hotkey")
+    
+    def test_failed_write_returns_false(self, settings_file, monkeypatch):
+        """Failure case: a failed write reports False and leaves no temp file."""
+        manager = ConfigManager(str(settings_file))
+        manager.set("hotkey", "ctrl+alt+d")
+        
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+        
+        monkeypatch.setattr(config_module.os, "replace", fail_replace)
+        
+        assert manager.save_config() is False
+        assert not settings_file.exists()
+        assert not settings_file.with_suffix(".json.tmp").exists()
+
+
+class TestResolveRepoId:
+    """Model name to HuggingFace repo mapping."""
+    
+    def test_standard_size(self):
+        """Expected use: a size maps to faster-whisper's CTranslate2 repo."""
+        assert ModelDetector.resolve_repo_id("base") == "Systran/faster-whisper-base"
+    
+    def test_repo_id_is_returned_unchanged(self):
+        """Edge case: a full repo ID needs no mapping."""
+        assert ModelDetector.resolve_repo_id("openai/whisper-large-v3-turbo") == "openai/whisper-large-v3-turbo"
+    
+    def test_every_standard_model_has_a_repo(self):
+        """Edge case: the size list and the repo table cannot drift apart."""
+        for model in ModelDetector.STANDARD_MODELS:
+            assert "/" in ModelDetector.resolve_repo_id(model)
+    
+    def test_unknown_size_raises(self):
+        """Failure case: an unknown name is rejected instead of used as a repo."""
+        with pytest.raises(ValueError, match="Unknown model size 'huge'"):
+            ModelDetector.resolve_repo_id("huge")
+
+
+class TestGetHubDir:
+    """HuggingFace cache resolution shared by detection, downloads and the program."""
+    
+    @pytest.fixture(autouse=True)
+    def _clean_hub_env(self, monkeypatch):
+        """Clear the cache variables and the memoized result around each test."""
+        for name in ("HF_HUB_CACHE", "HUGGINGFACE_HUB_CACHE", "HF_HOME", "XDG_CACHE_HOME"):
+            monkeypatch.delenv(name, raising=False)
+        _get_hub_dir.cache_clear()
+        yield
+        _get_hub_dir.cache_clear()
+    
+    def test_hub_under_hf_home(self, monkeypatch, tmp_path):
+        """Expected use: the hub lives in HF_HOME/hub."""
+        monkeypatch.setenv("HF_HOME", str(tmp_path))
+        
+        assert _get_hub_dir() == tmp_path / "hub"
+    
+    def test_hub_cache_takes_precedence(self, monkeypatch, tmp_path):
+        """Edge case: HF_HUB_CACHE overrides HF_HOME, as in huggingface_hub."""
+        monkeypatch.setenv("HF_HOME", str(tmp_path / "home"))
+        monkeypatch.setenv("HF_HUB_CACHE", str(tmp_path / "hub-cache"))
+        
+        assert _get_hub_dir() == tmp_path / "hub-cache"
+    
+    def test_default_location(self):
+        """Edge case: with nothing configured the default cache is used."""
+        assert _get_hub_dir() == Path.home() / ".cache" / "huggingface" / "hub"
@@ -0,0 +1,69 @@
+"""Tests for the model download helpers in dictationer.gui."""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from dictationer.gui import _blob_etag, _select_transformers_files
+
+
+class TestSelectTransformersFiles:
+    """File selection for transformers-format model repos."""
+    
+    def test_prefers_safetensors_weights(self):
+        """Expected use: config, tokenizer and safetensors; no duplicate .bin weights."""
+        repo_files = [
+            ".gitattributes", "README.md", "config.json", "generation_config.json",
+            "tokenizer.json", "vocab.json", "merges.txt", "model.safetensors",
+            "pytorch_model.bin", "flax_model.msgpack", "tf_model.h5",
+        ]
+        
+        selected = _select_transformers_files(repo_files)
+        
+        assert sorted(selected) == [
+            "config.json", "generation_config.json", "merges.txt",
+            "model.safetensors", "tokenizer.json", "vocab.json",
+        ]
+    
+    def test_falls_back_to_sharded_pytorch_weights(self):
+        """Edge case: without safetensors every PyTorch shard is fetched."""
+        repo_files = [
+            "config.json", "pytorch_model-00001-of-00002.bin",
+            "pytorch_model-00002-of-00002.bin", "pytorch_model.bin.index.json",
+        ]
+        
+        selected = _select_transformers_files(repo_files)
+        
+        assert sorted(selected) == sorted(repo_files)
+    
+    def test_ignores_nested_files(self):
+        """Edge case: files in subfolders (e.g. other formats) are skipped."""
+        repo_files = ["config.json", "model.safetensors", "onnx/config.json", "ggml/model.safetensors"]
+        
+        assert sorted(_select_transformers_files(repo_files)) == ["config.json", "model.safetensors"]
+    
+    def test_repo_without_model_files(self):
+        """Failure case: nothing loadable selects nothing, which run() reports."""
+        assert _select_transformers_files([".gitattributes", "README.md", "flax_model.msgpack"]) == []
+
+
+class TestBlobEtag:
+    """Cache blob names for partial-download progress."""
+    
+    def test_lfs_file_uses_sha256(self):
+        """Expected use: LFS weights are stored under their SHA-256."""
+        sibling = SimpleNamespace(rfilename="model.bin", blob_id="git-sha1", lfs=SimpleNamespace(sha256="lfs-sha256"))
+        
+        assert _blob_etag(sibling) == "lfs-sha256"
+    
+    def test_regular_file_uses_blob_id(self):
+        """Edge case: small git files are stored under their git blob ID."""
+        sibling = SimpleNamespace(rfilename="config.json", blob_id="git-sha1", lfs=None)
+        
+        assert _blob_etag(sibling) == "git-sha1"
+    
+    def test_missing_metadata(self):
+        """Failure case: without file metadata there is no blob to measure."""
+        assert _blob_etag(SimpleNamespace(rfilename="config.json")) is None